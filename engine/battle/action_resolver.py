@@ -22,8 +22,9 @@ class TargetResult:
     hp_delta: int = 0
     mp_delta: int = 0
     is_ko: bool = False
-    status_applied: list[str] = field(default_factory=list)
-    status_removed: list[str] = field(default_factory=list)
+    # Read-only from the consumer side: may be a shared tuple (see resolve_defend).
+    status_applied: Sequence[str] = field(default_factory=list)
+    status_removed: Sequence[str] = field(default_factory=list)
 
 @dataclass
 class ActionResult:
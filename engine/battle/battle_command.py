@@ -1,9 +1,10 @@
 # engine/battle/battle_command.py
 
-from dataclasses import dataclass, field
-from typing import List, Any, Optional
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
 
-@dataclass
+@dataclass(slots=True)
 class BattleCommand:
     """
     A neutral, side-agnostic representation of an intended action.
@@ -18,9 +19,15 @@ class BattleCommand:
     item_id: Optional[str] = None
     item_qty: int = 1
 
-    # Concrete target objects or combatant IDs.
-    targets: List[Any] = field(default_factory=list)
+    # Concrete target objects or combatant IDs. Commands built without
+    # targets share this read-only empty default; consumers copy it.
+    targets: Sequence[Any] = ()
 
     # Debug / introspection fields (used by AI)
     source: str = "player"   # or "ai"
     reason: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # actor_id keys the session's id maps; intern it at construction.
+        if type(self.actor_id) is str:
+            self.actor_id = sys.intern(self.actor_id)
@@ -4,6 +4,12 @@ from __future__ import annotations
 from typing import Any, Optional
 
 
+# Shared, read-only status lists for defend results. Consumers only iterate
+# TargetResult.status_applied / status_removed, so tuples are safe to reuse.
+_DEFEND_STATUS_APPLIED: tuple[str, ...] = ("defend_1",)
+_EMPTY: tuple[str, ...] = ()
+
+
 def resolve_defend(command: Any) -> Any | None:
     """
     Build a defend ActionResult.
@@ -15,22 +21,16 @@ def resolve_defend(command: Any) -> Any | None:
 
     from engine.battle.action_resolver import ActionResult, TargetResult
 
-    res = ActionResult(
-        actor_id=actor_id,
-        command_type="defend",
-        skill_id=None,
-        item_id=None,
-        element=None,
-        targets=[
-            TargetResult(
-                target_id=actor_id,
-                hp_delta=0,
-                mp_delta=0,
-                status_applied=["defend_1"],
-                status_removed=[],
-            )
-        ],
+    target = TargetResult(
+        target_id=actor_id,
+        hp_delta=0,
+        mp_delta=0,
+        status_applied=_DEFEND_STATUS_APPLIED,
+        status_removed=_EMPTY,
     )
+
+    # skill_id / item_id / element keep their None defaults.
+    res = ActionResult(actor_id=actor_id, command_type="defend", targets=[target])
     res.success = True
     return res
 
@@ -114,6 +114,9 @@ def resolve_equip_weapon(command: Any) -> Any | None:
     if not actor_id or not weapon_id:
         return None
 
+    if type(weapon_id) is not str:
+        weapon_id = str(weapon_id)
+
     from engine.items.defs import get_item
     item_def = get_item(weapon_id)
     if item_def is None or getattr(item_def, "kind", None) != "weapon":
@@ -125,7 +128,7 @@ def resolve_equip_weapon(command: Any) -> Any | None:
         actor_id=actor_id,
         command_type="equip_weapon",
         skill_id=None,
-        item_id=str(weapon_id),
+        item_id=weapon_id,
         item_qty=1,
         element=None,
         targets=[],
@@ -13,12 +13,14 @@
 
 from __future__ import annotations
 from typing import Any, List, Dict, Optional
-import math
 
 
 # purely visual midpoint marker (HUD can read this)
 CTB_COMMIT_THRESHOLD = 0.5
 
+# Actors whose next_turn_time is within this of t_min share a ready batch.
+_READY_EPSILON = 1e-6
+
 
 class ActorTurnState:
     """Tracks timing info for one actor in the CTB system."""
@@ -28,6 +30,28 @@ class ActorTurnState:
         self.last_turn_time = start_time
         self.next_turn_time = start_time  # will be scheduled immediately
 
+        # Cached 1 / effective SPD, refreshed only when spd_key changes.
+        self.inv_spd: float = 0.0
+        self.spd_key: Any = None
+
+    def recompute_inv_spd(self, spd: float, status_mgr: Any) -> None:
+        """Refresh inv_spd from base SPD + the owner's current stat modifiers."""
+        spd_mult = 1.0
+        spd_add = 0.0
+
+        if status_mgr and hasattr(status_mgr, "get_stat_modifiers"):
+            mods = status_mgr.get_stat_modifiers()
+            spd_mult = float(mods.get("spd_mult", 1.0))
+            spd_add = float(mods.get("spd_add", 0.0))
+
+        eff_spd = max(0.0, spd * spd_mult + spd_add)
+
+        # Prevent division by zero — immobile characters have a huge delay.
+        if eff_spd <= 0:
+            eff_spd = 0.000001
+
+        self.inv_spd = 1.0 / eff_spd
+
 
 class CTBSystem:
     """
@@ -61,6 +85,17 @@ class CTBSystem:
             st = ActorTurnState(actor, self.time)
             self.states[actor] = st
 
+        # Living / KO'd actors' states, rebuilt lazily (None == dirty).
+        # HP is written directly by the session, effects and DoTs, so the
+        # split is re-validated in update(): a KO'd actor is caught when it
+        # reaches the front of the queue, a revive by polling _dead_states.
+        self._alive_states: Optional[List[ActorTurnState]] = None
+        self._dead_states: List[ActorTurnState] = []
+
+        # Earliest next_turn_time among _alive_states (None == recompute).
+        # Cleared on every reschedule and whenever the living set is rebuilt.
+        self._t_min: Optional[float] = None
+
         # Initial scheduling: everyone gets a first "next turn"
         for actor in self.actors:
             self.schedule_next_turn(actor)
@@ -72,6 +107,9 @@ class CTBSystem:
         """
         Schedule this actor's next turn based on:
             next_turn_time = last_turn_time + (base_delay / SPD)
+
+        1 / SPD is cached on the ActorTurnState and refreshed only when
+        base SPD or the StatusManager's version changes.
         """
         st = self.states.get(actor)
         if st is None:
@@ -80,23 +118,19 @@ class CTBSystem:
         # Pull effective SPD (includes status modifiers)
         spd = float(getattr(actor, "spd", 0.0))
         status_mgr = getattr(actor, "status", None)
-        spd_mult = 1.0
-        spd_add = 0.0
-
-        if status_mgr and hasattr(status_mgr, "get_stat_modifiers"):
-            mods = status_mgr.get_stat_modifiers()
-            spd_mult = float(mods.get("spd_mult", 1.0))
-            spd_add = float(mods.get("spd_add", 0.0))
-
-        eff_spd = max(0.0, spd * spd_mult + spd_add)
 
-        # Prevent division by zero — immobile characters have a huge delay.
-        if eff_spd <= 0:
-            eff_spd = 0.000001
+        # Only re-derive effective SPD when base SPD or the status list changed.
+        # Status managers without a version counter are always recomputed.
+        version = getattr(status_mgr, "version", None)
+        spd_key = (spd, status_mgr, version) if version is not None else None
+        if spd_key is None or spd_key != st.spd_key:
+            st.recompute_inv_spd(spd, status_mgr)
+            st.spd_key = spd_key
 
-        delay = self.base_delay / eff_spd
+        delay = self.base_delay * st.inv_spd
         st.last_turn_time = st.next_turn_time
         st.next_turn_time = st.last_turn_time + delay
+        self._t_min = None
 
     # ------------------------------------------------------------
     # Gauge ratio: purely visual
@@ -140,41 +174,67 @@ class CTBSystem:
         if not self.running or dt <= 0.0:
             return None
 
-        # Identify the next moment when ANY living actor gets a turn.
-        next_times: List[float] = []
-        for st in self.states.values():
-            actor = st.actor
-            if getattr(actor, "alive", True):
-                next_times.append(st.next_turn_time)
-
-        if not next_times:
-            return None  # no living actors?
-
-        t_min = min(next_times)
-
-        # If T + dt doesn't reach the next turn moment, simply advance time.
-        if self.time + dt < t_min:
-            self.time += dt
-            return None
-
-        # Otherwise, we cross a turn boundary:
-        #   1) Advance T exactly to t_min
-        #   2) Collect all actors whose next_turn_time == t_min
+        # Revived since the last rebuild? (only KO'd actors are polled)
+        for st in self._dead_states:
+            if getattr(st.actor, "alive", True):
+                self._alive_states = None
+                break
+
+        while True:
+            alive_states = self._alive_states
+            if alive_states is None:
+                alive_states = self._rebuild_alive_states()
+
+            if not alive_states:
+                return None  # no living actors?
+
+            # Identify the next moment when ANY living actor gets a turn.
+            t_min = self._t_min
+            if t_min is None:
+                t_min = min(st.next_turn_time for st in alive_states)
+                self._t_min = t_min
+
+            # If T + dt doesn't reach the next turn moment, simply advance time.
+            if self.time + dt < t_min:
+                self.time += dt
+                return None
+
+            # Collect all actors whose next_turn_time == t_min
+            # (tiny epsilon to avoid float friction; absolute tolerance only,
+            # same as math.isclose(..., abs_tol=_READY_EPSILON) at these scales)
+            due = [
+                st for st in alive_states
+                if -_READY_EPSILON <= st.next_turn_time - t_min <= _READY_EPSILON
+            ]
+
+            # Someone due was KO'd since the last rebuild: drop the stale
+            # living set / t_min and look again before moving the clock.
+            if all(getattr(st.actor, "alive", True) for st in due):
+                break
+            self._alive_states = None
+
+        # We cross a turn boundary: advance T exactly to t_min.
         self.time = t_min
+        ready_batch: List[Any] = [st.actor for st in due]
 
-        ready_batch: List[Any] = []
-        for actor, st in self.states.items():
-            if not getattr(actor, "alive", True):
-                continue
-
-            # tiny epsilon to avoid float friction
-            if math.isclose(st.next_turn_time, t_min, abs_tol=1e-6):
-                ready_batch.append(actor)
+        # The batch is about to act and be rescheduled; recompute next time.
+        self._t_min = None
 
         # NOTE: We do NOT auto-pause here; the controller decides
         # when to pause()/resume() based on its own state.
         return ready_batch
 
+    def _rebuild_alive_states(self) -> List[ActorTurnState]:
+        """Split actor states into living / KO'd and reset t_min."""
+        self._t_min = None
+        alive: List[ActorTurnState] = []
+        dead: List[ActorTurnState] = []
+        for st in self.states.values():
+            (alive if getattr(st.actor, "alive", True) else dead).append(st)
+        self._alive_states = alive
+        self._dead_states = dead
+        return alive
+
     # ------------------------------------------------------------
     # Controller-facing controls
     # ------------------------------------------------------------
@@ -203,3 +263,4 @@ class CTBSystem:
         st.last_turn_time = self.time
         st.next_turn_time = self.time
         self.schedule_next_turn(actor)
+        self._alive_states = None
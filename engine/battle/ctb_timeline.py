@@ -54,6 +54,11 @@ class CTBTimeline:
         # Mapping: combatant_id -> gauge value (0 to 100+)
         self.gauges: Dict[str, float] = {}
 
+        # Mapping: combatant_id -> combatant object. The object behind an id
+        # never changes mid-battle, so update() reads KO state from here
+        # instead of calling session.get_combatant() every tick.
+        self._nodes: Dict[str, Any] = {}
+
         # Build initial gauges for alive combatants
         for obj in session.iter_all_combatants(alive_only=True):
             cid = getattr(obj, "id", None)
@@ -62,6 +67,7 @@ class CTBTimeline:
                     f"Combatant object {obj!r} must have an 'id' attribute for CTB."
                 )
             self.gauges[cid] = 0.0
+            self._nodes[cid] = obj
 
         # Timeline active flag (ActionMapper will freeze/unfreeze)
         self.paused: bool = False
@@ -95,12 +101,18 @@ class CTBTimeline:
             return None
 
         ready_list: List[str] = []
+        nodes = self._nodes
+        is_ko = self.session._is_ko
 
         # Increment gauges
         for cid, gauge in self.gauges.items():
-            # Skip KO'd actors (their gauges stay frozen)
-            obj = self.session.get_combatant(cid)
-            if self.session._is_ko(obj):
+            # Skip KO'd actors (their gauges stay frozen).
+            # KO is still read per tick: skills write HP directly (including
+            # revives), so there is no hook that could maintain an alive set.
+            obj = nodes.get(cid)
+            if obj is None:
+                obj = self._node_for(cid)
+            if is_ko(obj):
                 continue
 
             # For now: placeholder flat increment
@@ -133,12 +145,19 @@ class CTBTimeline:
     #  Maintenance (when someone dies, leaves, or gets revived)
     # ------------------------------------------------------------------ #
 
+    def _node_for(self, combatant_id: str) -> Any:
+        """Resolve and cache the combatant object for an id."""
+        obj = self.session.get_combatant(combatant_id)
+        self._nodes[combatant_id] = obj
+        return obj
+
     def remove_combatant(self, combatant_id: str) -> None:
         """
         Called when an actor permanently leaves the field
         (e.g., unsummon, phase swap out, etc.).
         """
         self.gauges.pop(combatant_id, None)
+        self._nodes.pop(combatant_id, None)
 
     def add_combatant(self, combatant_id: str) -> None:
         """
@@ -5,39 +5,91 @@
 # flows through this one shared function.
 
 from __future__ import annotations
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, List, NamedTuple, Sequence
+import random
 
 
-def _get_effective_stats(entity: Any) -> Dict[str, float]:
+class EffectiveStats(NamedTuple):
+    """Effective (status-modified) stat block returned by _get_effective_stats."""
+    atk: float
+    mag: float
+    defense: float
+    mres: float
+    spd: float
+
+
+def _read_base_stats(entity: Any) -> Tuple[float, float, float, float, float]:
+    """
+    Read (atk, mag, defense, mres, spd) as floats, 0 for missing fields.
+
+    Plain per-field getattr: PlayerCombatant carries `res` rather than
+    `mres`, so an all-or-nothing attrgetter would raise (and fall back)
+    on every party-member read.
+    """
+    return (
+        float(getattr(entity, "atk", 0)),
+        float(getattr(entity, "mag", 0)),
+        float(getattr(entity, "defense", 0)),
+        float(getattr(entity, "mres", 0)),
+        float(getattr(entity, "spd", 0)),
+    )
+
+
+def _get_effective_stats(entity: Any) -> EffectiveStats:
     """
     Build a full effective stat block from entity:
       - base stats (atk, mag, defense, mres, spd)
       - status modifiers (mults + adds via StatusManager.get_stat_modifiers)
+
+    Callers needing the raw modifier dict should ask the StatusManager
+    directly (get_stat_modifiers()).
+
+    Fast path: when the StatusManager reports is_neutral() (no active
+    stat-modifying status), base stats are returned unchanged. Managers
+    exposing stat_modifiers() serve both answers from a per-version memo.
     """
-    base_atk = float(getattr(entity, "atk", 0))
-    base_mag = float(getattr(entity, "mag", 0))
-    base_def = float(getattr(entity, "defense", 0))
-    base_mres = float(getattr(entity, "mres", 0))
-    base_spd = float(getattr(entity, "spd", 0))
+    base_atk, base_mag, base_def, base_mres, base_spd = _read_base_stats(entity)
 
     status_mgr = getattr(entity, "status", None)
-    if status_mgr and hasattr(status_mgr, "get_stat_modifiers"):
-        mods = status_mgr.get_stat_modifiers()
+    if status_mgr is None:
+        return EffectiveStats(base_atk, base_mag, base_def, base_mres, base_spd)
+
+    stat_modifiers = getattr(status_mgr, "stat_modifiers", None)
+    if stat_modifiers is not None:
+        mods = stat_modifiers()
     else:
-        # default neutral
-        mods = {
-            "atk_mult": 1.0, "def_mult": 1.0, "mag_mult": 1.0, "mres_mult": 1.0, "spd_mult": 1.0,
-            "atk_add": 0.0, "def_add": 0.0, "mag_add": 0.0, "mres_add": 0.0, "spd_add": 0.0,
-        }
-
-    return {
-        "atk": base_atk * mods["atk_mult"] + mods["atk_add"],
-        "mag": base_mag * mods["mag_mult"] + mods["mag_add"],
-        "def": base_def * mods["def_mult"] + mods["def_add"],
-        "mres": base_mres * mods["mres_mult"] + mods["mres_add"],
-        "spd": base_spd * mods["spd_mult"] + mods["spd_add"],
-        "mods": mods,
-    }
+        is_neutral = getattr(status_mgr, "is_neutral", None)
+        if not hasattr(status_mgr, "get_stat_modifiers") or (
+            is_neutral is not None and is_neutral()
+        ):
+            mods = None
+        else:
+            mods = status_mgr.get_stat_modifiers()
+
+    if mods is None:
+        return EffectiveStats(base_atk, base_mag, base_def, base_mres, base_spd)
+
+    return EffectiveStats(
+        atk=base_atk * mods["atk_mult"] + mods["atk_add"],
+        mag=base_mag * mods["mag_mult"] + mods["mag_add"],
+        defense=base_def * mods["def_mult"] + mods["def_add"],
+        mres=base_mres * mods["mres_mult"] + mods["mres_add"],
+        spd=base_spd * mods["spd_mult"] + mods["spd_add"],
+    )
+
+
+def mitigate(base_damage: float, defensive: float, variance: float) -> int:
+    """
+    Numeric core of the damage model (steps 2–4 of compute_damage):
+    linear DEF/MRES shave, ±variance roll, clamp to at least 1.
+
+    Plain floats in, int out – shared by compute_damage,
+    compute_damage_batch and DotStatus so the formula lives in one place.
+    """
+    raw = base_damage - (defensive * 0.6)
+    if variance > 0:
+        raw *= 1.0 + random.uniform(-variance, variance)
+    return int(max(1, raw))
 
 
 def compute_damage(
@@ -74,33 +126,20 @@ def compute_damage(
     # 1) Choose appropriate defense axis for mitigation
     # ------------------------------------------------------------
     if damage_type == "magic":
-        offensive = atk["mag"]
-        defensive = dfd["mres"]
+        offensive = atk.mag
+        defensive = dfd.mres
     else:
-        offensive = atk["atk"]
-        defensive = dfd["def"]
+        offensive = atk.atk
+        defensive = dfd.defense
 
     # ------------------------------------------------------------
-    # 2) Base formula (tunable)
+    # 2-4) Base formula (tunable), ±variance %, clamp minimum
     #
     # Forge XVII.18c convention:
     #   - base_damage is pre-defense damage (already includes ATK/MAG & skill coeffs)
     #   - defensive stat shaves off a linear portion
     # ------------------------------------------------------------
-    raw = base_damage - (defensive * 0.6)
-
-    # ------------------------------------------------------------
-    # 3) Apply ±variance %
-    # ------------------------------------------------------------
-    if variance > 0:
-        import random
-        factor = 1.0 + random.uniform(-variance, variance)
-        raw *= factor
-
-    # ------------------------------------------------------------
-    # 4) Clamp minimum
-    # ------------------------------------------------------------
-    raw = int(max(1, raw))
+    raw = mitigate(base_damage, defensive, variance)
 
     breakdown = {
         "offensive": offensive,
@@ -114,3 +153,45 @@ def compute_damage(
 
     return raw, breakdown
 
+
+def compute_damage_batch(
+    attacker: Any,
+    defenders: Sequence[Any],
+    *,
+    element: str = "none",
+    base_damage: float = 1.0,
+    damage_type: str = "physical",
+    variance: float = 0.10,
+) -> List[Tuple[int, Dict[str, float]]]:
+    """
+    AoE variant of compute_damage(): one (raw, breakdown) per defender.
+
+    Same formula and same RNG draw order as calling compute_damage() once
+    per defender, but the attacker's effective stats, the defense axis and
+    the variance sampler are resolved once for the whole batch.
+    """
+    atk = _get_effective_stats(attacker)
+    if damage_type == "magic":
+        offensive = atk.mag
+        def_index = 3  # EffectiveStats.mres
+    else:
+        offensive = atk.atk
+        def_index = 2  # EffectiveStats.defense
+
+    results: List[Tuple[int, Dict[str, float]]] = []
+
+    for defender in defenders:
+        defensive = _get_effective_stats(defender)[def_index]
+        raw = mitigate(base_damage, defensive, variance)
+
+        results.append((raw, {
+            "offensive": offensive,
+            "defensive": defensive,
+            "base_damage": base_damage,
+            "element": element,
+            "damage_type": damage_type,
+            "variance_applied": variance,
+            "final_raw": raw,
+        }))
+
+    return results
@@ -10,39 +10,63 @@ class WeaponBonus:
     mag_bonus: float = 0.0
 
 
+# Shared neutral result (WeaponBonus is frozen, so one instance is enough).
+_NO_BONUS = WeaponBonus()
+
+# weapon_id -> WeaponBonus. Only resolved weapons are cached: item defs are
+# never overwritten once registered, so a cached hit can't go stale.
+_WEAPON_BONUS_CACHE: dict[str, WeaponBonus] = {}
+
+
+def _weapon_bonus_for_id(weapon_id: str) -> WeaponBonus:
+    bonus = _WEAPON_BONUS_CACHE.get(weapon_id)
+    if bonus is not None:
+        return bonus
+
+    # local import keeps cycles down
+    from engine.items.defs import get_item
+    wdef = get_item(weapon_id)
+    if wdef is None or getattr(wdef, "kind", None) != "weapon":
+        return _NO_BONUS
+
+    # These fields will exist once we extend ItemDef + weapon library.
+    atk = float(getattr(wdef, "atk_bonus", 0.0) or 0.0)
+    mag = float(getattr(wdef, "mag_bonus", 0.0) or 0.0)
+    bonus = WeaponBonus(atk_bonus=atk, mag_bonus=mag)
+    _WEAPON_BONUS_CACHE[weapon_id] = bonus
+    return bonus
+
+
 def get_weapon_bonus_for_user(user: Any, battle_state: Any) -> WeaponBonus:
     """
     Battle-local weapon bonuses only.
 
     Reads:
       battle_state.runtime.equipment[actor_id] -> weapon_id
-    Looks up weapon def via engine.items.defs.get_item(weapon_id).
+    Looks up weapon def via engine.items.defs.get_item(weapon_id);
+    the resulting bonus is cached per weapon_id.
 
     If anything is missing, returns neutral bonuses.
     """
     runtime = getattr(battle_state, "runtime", None)
     if runtime is None:
-        return WeaponBonus()
+        return _NO_BONUS
 
     equip_map = getattr(runtime, "equipment", None)
     if not isinstance(equip_map, dict):
-        return WeaponBonus()
+        return _NO_BONUS
 
     actor_id = getattr(user, "id", None)
     if not actor_id:
-        return WeaponBonus()
+        return _NO_BONUS
 
-    weapon_id = equip_map.get(str(actor_id))
+    # IDs are strings throughout; only legacy save data needs the cast.
+    if type(actor_id) is not str:
+        actor_id = str(actor_id)
+    weapon_id = equip_map.get(actor_id)
     if not weapon_id:
-        return WeaponBonus()
-
-    # local import keeps cycles down
-    from engine.items.defs import get_item
-    wdef = get_item(str(weapon_id))
-    if wdef is None or getattr(wdef, "kind", None) != "weapon":
-        return WeaponBonus()
+        return _NO_BONUS
 
-    # These fields will exist once we extend ItemDef + weapon library.
-    atk = float(getattr(wdef, "atk_bonus", 0.0) or 0.0)
-    mag = float(getattr(wdef, "mag_bonus", 0.0) or 0.0)
-    return WeaponBonus(atk_bonus=atk, mag_bonus=mag)
+    if type(weapon_id) is not str:
+        weapon_id = str(weapon_id)
+    return _weapon_bonus_for_id(weapon_id)
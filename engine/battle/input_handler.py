@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional, Any
+import sys
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Any, Sequence
 
 
 class BattleCommand:
@@ -11,8 +13,16 @@ class BattleCommand:
         - skill_id / item_id
         - target_ids
         - optional flags (multi-target, alt mode)
+
+    Commands built without targets / flags share read-only empty defaults;
+    callers that need to mutate them must pass their own list / dict.
     """
 
+    __slots__ = ("actor_id", "command_type", "skill_id", "item_id", "target_ids", "flags")
+
+    _EMPTY_TARGETS: tuple[str, ...] = ()
+    _EMPTY_FLAGS: Mapping[str, Any] = MappingProxyType({})
+
     def __init__(
         self,
         *,
@@ -23,12 +33,12 @@ class BattleCommand:
         target_ids: Optional[List[str]] = None,
         flags: Optional[dict] = None,
     ) -> None:
-        self.actor_id = actor_id
+        self.actor_id = sys.intern(actor_id) if type(actor_id) is str else actor_id
         self.command_type = command_type
         self.skill_id = skill_id
         self.item_id = item_id
-        self.target_ids = target_ids or []
-        self.flags = flags or {}
+        self.target_ids: Sequence[str] = target_ids if target_ids else BattleCommand._EMPTY_TARGETS
+        self.flags: Mapping[str, Any] = flags if flags else BattleCommand._EMPTY_FLAGS
 
 
 class BattleInputHandler:
@@ -47,6 +57,8 @@ class BattleInputHandler:
         Only define structure and placeholders. No input or UI implemented.
     """
 
+    __slots__ = ("session", "state", "active_actor_id")
+
     STATE_IDLE = "idle"
     STATE_MENU = "menu"
     STATE_TARGETING = "targeting"
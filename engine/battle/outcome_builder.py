@@ -1,9 +1,22 @@
 # engine/battle/outcome_builder.py
 from __future__ import annotations
 
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, List
+
 from engine.meta.battle_outcome import BattleOutcome
 
 
+def log_as_dicts(log: Any) -> List[Dict[str, Any]]:
+    """
+    Copy a BattleSession log into the dict records BattleOutcome carries.
+
+    Session logs hold slotted event records (LootEvent / XpEvent); legacy
+    dict entries pass through unchanged.
+    """
+    return [asdict(e) if is_dataclass(e) else e for e in (log or ())]
+
+
 def build_battle_outcome(*, runtime, controller) -> BattleOutcome:
     """
     Build the META-facing BattleOutcome only.
@@ -25,8 +38,9 @@ def build_battle_outcome(*, runtime, controller) -> BattleOutcome:
         except Exception:
             pass
 
-    xp_log = list(getattr(session, "xp_log", []) or []) if session is not None else []
-    loot_log = list(getattr(session, "loot_log", []) or []) if session is not None else []
+    # One copy each; a missing session/log simply yields an empty list.
+    xp_log = log_as_dicts(getattr(session, "xp_log", None))
+    loot_log = log_as_dicts(getattr(session, "loot_log", None))
 
     return BattleOutcome(
         victory=victory,
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 
 Facing = str  # "left" | "right"
@@ -22,8 +23,10 @@ class PartyLayout:
     Notes:
     - No front/back-row mechanics: geometry only.
     - Facing can be flipped for surprise/back-attack.
+    - Instances are cached and shared (see compute_party_layout), so slots
+      is an immutable tuple.
     """
-    slots: List[Tuple[int, int]]
+    slots: Tuple[Tuple[int, int], ...]
     facing: Facing
 
 
@@ -45,7 +48,14 @@ def compute_party_layout(
     flip:
         If True, the party appears on the right side and faces left.
         If False, party appears on the left side and faces right.
+
+    Pure function of its inputs; results are memoized.
     """
+    return _party_layout(bg_width, ground_y, bool(flip))
+
+
+@lru_cache(maxsize=16)
+def _party_layout(bg_width: int, ground_y: int, flip: bool) -> PartyLayout:
     # Anchor position on the party side of the stage.
     # These values are tuned to feel similar to your existing arena staging.
     anchor_x = int(bg_width * 0.22)
@@ -66,12 +76,12 @@ def compute_party_layout(
     dx_top = -8
     dy_top = -136  # top slot; slightly right of bottom via less negative dx
 
-    slots = [
+    slots = (
         (anchor_x + dx_front,  ground_y + dy_front),   # 0: front
         (anchor_x + dx_bottom, ground_y + dy_bottom),  # 1: bottom
         (anchor_x + dx_rear,   ground_y + dy_rear),    # 2: rear
         (anchor_x + dx_top,    ground_y + dy_top),     # 3: top / guest
-    ]
+    )
 
     facing: Facing = "left" if flip else "right"
     return PartyLayout(slots=slots, facing=facing)
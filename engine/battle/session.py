@@ -1,13 +1,83 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from weakref import WeakKeyDictionary
+
+from engine.battle.action_resolver import TargetResult
+from engine.battle.skills.statuses import make_defend_basic, make_frostbite_basic
+
+
+# Sentinel for single-probe getattr lookups.
+_MISSING = object()
+
+# status_applied id -> factory(user, target, battle_state) used by
+# apply_action_result. Ids not listed here are ignored.
+_STATUS_FACTORIES: Dict[str, Callable[[Any, Any, Any], Any]] = {
+    "frostbite_1": make_frostbite_basic,
+    "defend_1": make_defend_basic,
+}
+
+
+# check_battle_outcome, indexed by party_defeated | enemy_defeated << 1.
+# Mutual destruction counts as a victory – owner can interpret.
+_OUTCOME = ("ongoing", "defeat", "victory", "victory")
+
+
+# Fallback status-removal path (managers without pop_by_id/remove_by_id):
+# status_mgr -> (container attribute, stripper for that container kind),
+# probed once per manager.
+_STATUS_CONTAINER_ATTRS = ("effects", "_effects", "active", "_active")
+
+
+def _strip_ids_list(effs: list, ids: set) -> None:
+    # compact once instead of popping per match
+    effs[:] = [eff for eff in effs if getattr(eff, "id", None) not in ids]
+
+
+def _strip_ids_set(effs: set, ids: set) -> None:
+    effs.difference_update([eff for eff in effs if getattr(eff, "id", None) in ids])
+
+
+_StatusStripper = Optional[tuple[str, Callable[[Any, set], None]]]
+_STATUS_CONTAINER_CACHE: "WeakKeyDictionary[Any, _StatusStripper]" = WeakKeyDictionary()
+
+
+def _probe_status_container(status_mgr: Any) -> _StatusStripper:
+    for name in _STATUS_CONTAINER_ATTRS:
+        container = getattr(status_mgr, name, None)
+        if isinstance(container, list):
+            return name, _strip_ids_list
+        if isinstance(container, set):
+            return name, _strip_ids_set
+    return None
+
+
+def _remove_from_status_container(status_mgr: Any, removed: Iterable[str]) -> None:
+    """Drop every effect whose .id is in `removed` from the manager's container."""
+    try:
+        handler = _STATUS_CONTAINER_CACHE[status_mgr]
+    except KeyError:
+        handler = _probe_status_container(status_mgr)
+        _STATUS_CONTAINER_CACHE[status_mgr] = handler
+    except TypeError:
+        # Not weak-referenceable or unhashable: probe uncached every time.
+        handler = _probe_status_container(status_mgr)
+
+    if handler is None:
+        return
+
+    attr, strip = handler
+    effs = getattr(status_mgr, attr, None)
+    if effs:
+        strip(effs, set(removed))
 
 
 # --- Core flag container -----------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleFlags:
     """
     High-level battle flags that describe the scenario, NOT the flow.
@@ -28,7 +98,7 @@ class BattleFlags:
     extras: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatantRef:
     """
     Lightweight reference wrapper tying an ID string to a concrete combatant
@@ -39,6 +109,43 @@ class CombatantRef:
     side: str  # "party" | "enemy"
     obj: Any
 
+    # Per-object capabilities, resolved once so apply_action_result doesn't
+    # re-probe them for every target. max_hp / max_mp and the status manager
+    # can change mid-battle (level-ups, equipment, swapped managers), so
+    # they are read from the object each time.
+    has_hp: bool = field(default=False, init=False, repr=False)
+    set_hp: Optional[Callable[[int], None]] = field(default=None, init=False, repr=False)
+    has_mp: bool = field(default=False, init=False, repr=False)
+    is_enemy: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        obj = self.obj
+        self.has_hp = hasattr(obj, "hp")
+        self.set_hp = getattr(obj, "set_hp", None)
+        self.has_mp = hasattr(obj, "mp")
+        # Prefer explicit marker if present; otherwise fall back to side.
+        self.is_enemy = bool(getattr(obj, "is_enemy", False)) or self.side == "enemy"
+
+
+# --- Battle-local log records -------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class LootEvent:
+    """One loot drop recorded during battle (see BattleSession.log_loot)."""
+
+    enemy_id: str
+    item_id: str
+    qty: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class XpEvent:
+    """One XP gain recorded during battle (see BattleSession.log_xp)."""
+
+    source_enemy_id: str
+    amount: int
+
 
 # --- Core session object -----------------------------------------------------
 
@@ -65,6 +172,24 @@ class BattleSession:
     Think of it as: the board and all its pieces, frozen in their current state.
     """
 
+    __slots__ = (
+        "party",
+        "enemies",
+        "flags",
+        "_id_to_ref",
+        "_obj_id_to_cid",
+        "_all_combatants",
+        "_party_standing",
+        "_enemy_standing",
+        "loot_log",
+        "xp_log",
+        "turn_count",
+        "elapsed_time_ms",
+        # attached by the owner after construction
+        "gains",      # BattleGains (BattleRuntime)
+        "ledger",     # LedgerState (integrated runner)
+    )
+
     # --------------------------------------------------------------------- #
     # Construction
     # --------------------------------------------------------------------- #
@@ -90,16 +215,23 @@ class BattleSession:
 
         # Lookup tables
         self._id_to_ref: Dict[str, CombatantRef] = {}
+        # Reverse map: id(obj) -> combatant_id (objects are pinned by _id_to_ref)
+        self._obj_id_to_cid: Dict[int, str] = {}
         self._build_id_map()
 
         # Battle-local logs (consumed at BattleOutcome time)
-        self.loot_log: List[Dict[str, Any]] = []  # e.g. {"enemy_id": "...", "item_id": "...", "qty": 1}
-        self.xp_log: List[Dict[str, Any]] = []    # e.g. {"source_enemy_id": "...", "amount": 32}
+        # (converted to plain dicts at the BattleOutcome boundary)
+        self.loot_log: List[LootEvent] = []
+        self.xp_log: List[XpEvent] = []
 
         # Counters & snapshot-ish fields
         self.turn_count: int = 0
         self.elapsed_time_ms: int = 0  # optional; can be advanced by the main loop
 
+        # Optional collaborators, attached by the owner
+        self.gains: Any = None
+        self.ledger: Any = None
+
     # --------------------------------------------------------------------- #
     # Internal helpers
     # --------------------------------------------------------------------- #
@@ -111,22 +243,41 @@ class BattleSession:
         Strategy:
             - If an object has .id, we use that.
             - Else, we synthesize IDs like "party_0", "enemy_1".
+
+        String IDs are interned so the many ID-keyed dict lookups during
+        action resolution hit the identity fast path.
         """
         self._id_to_ref.clear()
+        self._obj_id_to_cid.clear()
 
         # Party
         for idx, obj in enumerate(self.party):
             cid = getattr(obj, "id", None)
             if cid is None:
                 cid = f"party_{idx}"
+            if type(cid) is str:
+                cid = sys.intern(cid)
             self._id_to_ref[cid] = CombatantRef(id=cid, side="party", obj=obj)
+            self._obj_id_to_cid[id(obj)] = cid
 
         # Enemies
         for idx, obj in enumerate(self.enemies):
             cid = getattr(obj, "id", None)
             if cid is None:
                 cid = f"enemy_{idx}"
+            if type(cid) is str:
+                cid = sys.intern(cid)
             self._id_to_ref[cid] = CombatantRef(id=cid, side="enemy", obj=obj)
+            self._obj_id_to_cid[id(obj)] = cid
+
+        # Flat snapshot of every registered combatant, in id-map order
+        self._all_combatants: tuple[Any, ...] = tuple(
+            ref.obj for ref in self._id_to_ref.values()
+        )
+
+        # Last combatant seen standing on each side (see _find_standing)
+        self._party_standing: Any = None
+        self._enemy_standing: Any = None
 
     # --------------------------------------------------------------------- #
     # Public accessors
@@ -136,8 +287,10 @@ class BattleSession:
         Given a combatant object, return its stable combatant_id as
         tracked by this session. Raises KeyError if not found.
         """
-        for cid, ref in self._id_to_ref.items():
-            if ref.obj is obj:
+        cid = self._obj_id_to_cid.get(id(obj))
+        if cid is not None:
+            ref = self._id_to_ref.get(cid)
+            if ref is not None and ref.obj is obj:
                 return cid
         raise KeyError(f"Object {obj!r} is not registered in this BattleSession.")
 
@@ -160,40 +313,66 @@ class BattleSession:
         Iterate over all combatant objects.
         If alive_only=True, filters out KOs.
         """
-        for ref in self._id_to_ref.values():
-            obj = ref.obj
-            if not alive_only or not self._is_ko(obj):
-                yield obj
+        if not alive_only:
+            return iter(self._all_combatants)
+        _ko = self._is_ko
+        return (obj for obj in self._all_combatants if not _ko(obj))
 
     def iter_party(self, *, alive_only: bool = False):
-        for obj in self.party:
-            if not alive_only or not self._is_ko(obj):
-                yield obj
+        if not alive_only:
+            return iter(self.party)
+        _ko = self._is_ko
+        return (obj for obj in self.party if not _ko(obj))
 
     def iter_enemies(self, *, alive_only: bool = False):
-        for obj in self.enemies:
-            if not alive_only or not self._is_ko(obj):
-                yield obj
+        if not alive_only:
+            return iter(self.enemies)
+        _ko = self._is_ko
+        return (obj for obj in self.enemies if not _ko(obj))
 
     # --------------------------------------------------------------------- #
     # KO / victory / defeat helpers
     # --------------------------------------------------------------------- #
 
     def _is_ko(self, combatant: Any) -> bool:
-        if hasattr(combatant, "is_ko"):
-            return bool(getattr(combatant, "is_ko"))
-        if hasattr(combatant, "hp"):
-            return getattr(combatant, "hp") <= 0
+        # One getattr per probe (sentinel) instead of hasattr + getattr.
+        flag = getattr(combatant, "is_ko", _MISSING)
+        if flag is not _MISSING:
+            return bool(flag)
+        hp = getattr(combatant, "hp", _MISSING)
+        if hp is not _MISSING:
+            return hp <= 0
         return False
 
+    def _find_standing(self, members: List[Any], hint: Any) -> Any:
+        """
+        Return a member of `members` that is not KO, or None.
+
+        `hint` (the last member found standing) is probed first, so while a
+        battle is running the answer is usually a single KO check. HP is
+        also written directly by skills and status ticks, so standing-ness
+        is re-checked here rather than tracked as a counter.
+        """
+        _ko = self._is_ko
+        if hint is not None and not _ko(hint):
+            return hint
+        for c in members:
+            if not _ko(c):
+                return c
+        return None
+
     def is_party_defeated(self) -> bool:
         """True if all party members are KO."""
-        return all(self._is_ko(c) for c in self.party)
+        standing = self._find_standing(self.party, self._party_standing)
+        self._party_standing = standing
+        return standing is None
 
     def is_enemy_defeated(self) -> bool:
         """True if all enemies are KO."""
         # An empty enemy list can be treated as 'defeated' as well.
-        return len(self.enemies) == 0 or all(self._is_ko(c) for c in self.enemies)
+        standing = self._find_standing(self.enemies, self._enemy_standing)
+        self._enemy_standing = standing
+        return standing is None
 
     def is_battle_over(self) -> bool:
         """Simple victory/defeat check. More nuance will live in ActionMapper."""
@@ -212,16 +391,7 @@ class BattleSession:
         """
         party_defeated = self.is_party_defeated()
         enemy_defeated = self.is_enemy_defeated()
-
-        if party_defeated and not enemy_defeated:
-            return "defeat"
-        if enemy_defeated and not party_defeated:
-            return "victory"
-        if enemy_defeated and party_defeated:
-            # Edge-case: mutual destruction – owner can interpret.
-            return "victory"
-
-        return "ongoing"
+        return _OUTCOME[party_defeated | (enemy_defeated << 1)]
 
     # --------------------------------------------------------------------- #
     # Action application helpers (ActionResult → world state)
@@ -235,117 +405,105 @@ class BattleSession:
         In Forge XVII.13, this will be used in limited, test-scoped
         paths; the legacy controller remains authoritative for now.
         """
-        # Local import to avoid circular import at module load time
-        from engine.battle.action_resolver import TargetResult  # type: ignore
-
-        # HP / MP deltas per target
+        # Resolve targets once, then apply in separate HP / MP / status
+        # passes so each loop only carries the branches it needs.
+        get_ref = self._id_to_ref.get
+        entries: List[tuple[CombatantRef, Any]] = []
         for t in result.targets:
             if not isinstance(t, TargetResult):
                 continue
 
-            try:
-                combatant = self.get_combatant(t.target_id)
-            except KeyError:
+            ref = get_ref(t.target_id)
+            if ref is None:
                 # If we can't find the target, skip silently – this is a
                 # data issue, not a runtime crash.
                 continue
+            entries.append((ref, t))
 
-            # Apply HP delta (clamped) — use combatant mutation hook if available
-            if hasattr(combatant, "hp"):
-                cur_hp = int(getattr(combatant, "hp", 0))
-                pre_hp = cur_hp  # <-- ADD THIS
-                new_hp = cur_hp + int(t.hp_delta)
-
-                max_hp = getattr(combatant, "max_hp", None)
-                if max_hp is not None:
-                    new_hp = max(0, min(int(max_hp), new_hp))
-                else:
-                    new_hp = max(0, new_hp)
+        gains = getattr(self, "gains", None)
 
-                if hasattr(combatant, "set_hp"):
-                    combatant.set_hp(new_hp)
-                else:
-                    combatant.hp = new_hp
-                # -----------------------------
-                # BattleGains: enemy defeat (alive -> dead)
-                # -----------------------------
+        # 1) HP deltas (clamped) — use combatant mutation hook if available
+        for ref, t in entries:
+            if not ref.has_hp:
+                continue
+            combatant = ref.obj
+            pre_hp = int(combatant.hp)
+            new_hp = pre_hp + int(t.hp_delta)
+
+            max_hp = getattr(combatant, "max_hp", None)
+            if new_hp < 0:
+                new_hp = 0
+            elif max_hp is not None and new_hp > int(max_hp):
+                new_hp = int(max_hp)
+
+            set_hp = ref.set_hp
+            if set_hp is not None:
+                set_hp(new_hp)
+            else:
+                combatant.hp = new_hp
+            # -----------------------------
+            # BattleGains: enemy defeat (alive -> dead)
+            # -----------------------------
+            if gains is not None and ref.is_enemy and pre_hp > 0 and new_hp <= 0:
                 try:
-                    gains = getattr(self, "gains", None)
-                    if gains is not None:
-                        was_alive = pre_hp > 0
-                        is_dead = new_hp <= 0
-
-                        # Prefer explicit marker if present; otherwise fall back to membership check.
-                        is_enemy = bool(getattr(combatant, "is_enemy", False))
-                        if not is_enemy:
-                            # If your session stores enemies list, this is safe and simple:
-                            is_enemy = combatant in self.enemies
-
-                        if was_alive and is_dead and is_enemy:
-                            gains.mark_enemy_defeated(getattr(combatant, "id", None) or str(getattr(combatant, "name", "enemy")))
+                    gains.mark_enemy_defeated(getattr(combatant, "id", None) or str(getattr(combatant, "name", "enemy")))
                 except Exception:
                     pass
 
-            # Apply MP delta (clamped)
-            if hasattr(combatant, "mp"):
-                new_mp = getattr(combatant, "mp", 0) + int(t.mp_delta)
-                max_mp = getattr(combatant, "max_mp", None)
-                if max_mp is not None:
-                    new_mp = max(0, min(int(max_mp), new_mp))
-                combatant.mp = new_mp
-            # Apply status changes (status_applied)
+        # 2) MP deltas (clamped)
+        for ref, t in entries:
+            if not ref.has_mp:
+                continue
+            combatant = ref.obj
+            new_mp = combatant.mp + int(t.mp_delta)
+            max_mp = getattr(combatant, "max_mp", None)
+            if max_mp is not None:
+                max_mp = int(max_mp)
+                if new_mp < 0:
+                    new_mp = 0
+                elif new_mp > max_mp:
+                    new_mp = max_mp
+            combatant.mp = new_mp
+
+        # 3) Status changes — only targets that carry any
+        for ref, t in entries:
+            applied = t.status_applied
+            removed = t.status_removed
+            if not applied and not removed:
+                continue
+            combatant = ref.obj
             status_mgr = getattr(combatant, "status", None)
-            applied = getattr(t, "status_applied", None) or []
-            if status_mgr is not None and applied:
-                from engine.battle.skills.statuses import make_frostbite_basic, make_defend_basic
-
-                for sid in applied:
-                    if sid == "frostbite_1":
-                        # Minimal viable context:
-                        # - target is the combatant receiving the status
-                        # - user: fall back to target for now (we'll improve source later)
-                        # - battle_state: use the session as the context object
-                        effect = make_frostbite_basic(combatant, combatant, self)
-                        status_mgr.add(effect)
-                    elif sid == "defend_1":
-                        effect = make_defend_basic(combatant, combatant, self)
-                        status_mgr.add(effect)
+            if status_mgr is None:
+                continue
+
+            # Apply status changes (status_applied)
+            for sid in applied or ():
+                factory = _STATUS_FACTORIES.get(sid)
+                if factory is not None:
+                    # Minimal viable context:
+                    # - target is the combatant receiving the status
+                    # - user: fall back to target for now (we'll improve source later)
+                    # - battle_state: use the session as the context object
+                    status_mgr.add(factory(combatant, combatant, self))
+
             # Apply status removals (status_removed)
-            removed = getattr(t, "status_removed", None) or []
-            if status_mgr is not None and removed:
-                # Try common containers on the status manager
-                for sid in removed:
-                    # If the manager has a dedicated remover, prefer it
-                    if hasattr(status_mgr, "remove_by_id"):
-                        status_mgr.remove_by_id(sid)
-                        continue
-
-                    # Otherwise, search known effect containers
-                    for attr in ("effects", "_effects", "active", "_active"):
-                        effs = getattr(status_mgr, attr, None)
-                        if not effs:
-                            continue
-
-                        # list-like
-                        if isinstance(effs, list):
-                            for i in range(len(effs) - 1, -1, -1):
-                                eff = effs[i]
-                                if getattr(eff, "id", None) == sid:
-                                    effs.pop(i)
-
-                        # set-like
-                        elif isinstance(effs, set):
-                            to_remove = None
-                            for eff in effs:
-                                if getattr(eff, "id", None) == sid:
-                                    to_remove = eff
-                                    break
-                            if to_remove is not None:
-                                effs.discard(to_remove)
+            if removed:
+                # Prefer the manager's batch remover, then its per-id
+                # remover; scanning its container is the last resort.
+                pop_by_id = getattr(status_mgr, "pop_by_id", None)
+                if pop_by_id is not None:
+                    pop_by_id(removed)
+                else:
+                    remove_by_id = getattr(status_mgr, "remove_by_id", None)
+                    if remove_by_id is not None:
+                        for sid in removed:
+                            remove_by_id(sid)
+                    else:
+                        _remove_from_status_container(status_mgr, removed)
+
         # -----------------------------
         # BattleGains: item consumption (explicit only; once per resolved action)
         # -----------------------------
-        gains = getattr(self, "gains", None)
         if gains is not None:
             try:
                 consumed_items = getattr(result, "consumed_items", None) or []
@@ -367,22 +525,11 @@ class BattleSession:
         Record a loot event. This does NOT touch global inventory;
         OutcomeBuilder (meta outcome) + Ledger commit step (later).
         """
-        self.loot_log.append(
-            {
-                "enemy_id": enemy_id,
-                "item_id": item_id,
-                "qty": qty,
-            }
-        )
+        self.loot_log.append(LootEvent(enemy_id, item_id, qty))
 
     def log_xp(self, *, source_enemy_id: str, amount: int) -> None:
         """
         Record an XP gain event generated by a kill.
         The actual distribution to party members happens during POST_RESOLVE.
         """
-        self.xp_log.append(
-            {
-                "source_enemy_id": source_enemy_id,
-                "amount": amount,
-            }
-        )
+        self.xp_log.append(XpEvent(source_enemy_id, amount))
@@ -11,8 +11,9 @@
 # to decide how to animate things.
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence, Callable
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Callable
 from engine.battle.status.status_events import StatusEvent
 
 SkillEffectFunc = Callable[[Any, Any, Any], None]  # (user, target, battle_state)
@@ -30,7 +31,21 @@ CategoryType = str  # "damage", "heal", "buff", "debuff", "shield", "revive", "h
 # Skill metadata + definition
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Canonical tag frozensets: skills declaring the same tags share one
+# instance, and every tag string inside is interned.
+_TAG_SETS: Dict[frozenset, frozenset] = {}
+
+
+def _canonical_tags(tags: Any) -> frozenset:
+    key = tags if type(tags) is frozenset else frozenset(tags or ())
+    canon = _TAG_SETS.get(key)
+    if canon is None:
+        canon = frozenset(map(sys.intern, key))
+        _TAG_SETS[canon] = canon
+    return canon
+
+
+@dataclass(slots=True, frozen=True)
 class SkillMeta:
     """
     Describes *what* a skill is, but not *how* it works internally.
@@ -56,10 +71,25 @@ class SkillMeta:
     mp_cost: int = 0
     target_type: TargetType = "enemy_single"
     description: str = ""
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = frozenset()  # sets are accepted, frozen in __post_init__
     fx_tag: Optional[str] = None   # used by FX router / Arena
     menu_group: str = "arts"  # "attack", "arts", "fire", "ice", "item"
 
+    # user.lower(), computed once (registry lookups compare on it)
+    _user_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: normalise via object.__setattr__. The strings used as
+        # registry keys / lookup comparands are interned.
+        intern = sys.intern
+        object.__setattr__(self, "id", intern(self.id))
+        object.__setattr__(self, "user", intern(self.user))
+        object.__setattr__(self, "_user_lc", intern(self.user.lower()))
+        object.__setattr__(self, "element", intern(self.element))
+        object.__setattr__(self, "category", intern(self.category))
+        object.__setattr__(self, "target_type", intern(self.target_type))
+        object.__setattr__(self, "tags", _canonical_tags(self.tags))
+
     # Later we can add things like:
     #   ui_icon: Optional[str]
     #   unlock_level: int
@@ -82,8 +112,25 @@ class SkillEffect:
       - etc.
 
     The SkillResolver will call .apply(...) on each effect in sequence.
+
+    Subclasses are slotted, frozen dataclasses: effects are shared config
+    inside registered SkillDefinitions and must not be mutated.
     """
+    __slots__ = ()
+
     apply_to_user: bool = False
+
+    # Which of the chosen targets SkillResolver hands to apply():
+    #   "alive" – targets without hp, or with hp > 0
+    #   "dead"  – targets with hp <= 0
+    #   "any"   – all of them, unfiltered
+    target_mode: str = "any"
+    # True if apply() writes HP directly, so life states must be
+    # re-partitioned before the next effect runs.
+    alters_hp: bool = False
+    # True for DamageEffect (base.py can't import it; see SkillDefinition).
+    deals_damage: bool = False
+
     def apply(
         self,
         user: Any,
@@ -106,23 +153,51 @@ class SkillEffect:
         raise NotImplementedError("SkillEffect.apply() must be implemented")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillDefinition:
     """
     A complete skill: metadata + one or more SkillEffect components.
 
     This is what the SkillResolver will consume during battle.
+    Definitions are frozen once built; the registry shares them freely.
     """
 
     meta: SkillMeta
-    effects: List[SkillEffect] = field(default_factory=list)
+    effects: Tuple[SkillEffect, ...] = ()  # lists are accepted, frozen in __post_init__
+
+    # Per-effect apply_to_user flags, so SkillResolver doesn't re-probe
+    # every effect on every use.
+    _apply_to_user_mask: Tuple[bool, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # First DamageEffect in `effects` (or None); read by the registry's
+    # debug dump.
+    _first_damage_effect: Optional[SkillEffect] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        effects = self.effects
+        if type(effects) is not tuple:
+            effects = tuple(effects)
+            object.__setattr__(self, "effects", effects)
+        object.__setattr__(
+            self,
+            "_apply_to_user_mask",
+            tuple(bool(getattr(e, "apply_to_user", False)) for e in effects),
+        )
+        object.__setattr__(
+            self,
+            "_first_damage_effect",
+            next((e for e in effects if getattr(e, "deals_damage", False)), None),
+        )
 
 
 # ---------------------------------------------------------------------------
 # Resolution result (what the resolver returns to the controller/arena)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TargetChange:
     """
     Records what happened to a single target during a skill resolution.
@@ -149,7 +224,7 @@ class TargetChange:
     components: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillResolutionResult:
     """
     High-level outcome of resolving a single skill use.
@@ -166,11 +241,41 @@ class SkillResolutionResult:
 
     status_events: List[StatusEvent] = field(default_factory=list)
 
-    # Optional message to display in the battle log (can be auto-generated or custom).
-    message: Optional[str] = None
+    # Battle-log message chunks (see .message / add_message); joined on read
+    # so effects appending text don't rebuild the string each time.
+    _message_parts: List[str] = field(default_factory=list, repr=False)
     # Optional additional flags / metadata (e.g. "multi_hit", "critical", etc.)
     flags: Dict[str, Any] = field(default_factory=dict)
 
+    # id(target) -> its TargetChange in `targets`; maintained by
+    # effects._get_or_create_target_change / _find_target_change.
+    _tc_index: Dict[int, TargetChange] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def message(self) -> Optional[str]:
+        """Optional message to display in the battle log (None if unset)."""
+        parts = self._message_parts
+        if not parts:
+            return None
+        return parts[0] if len(parts) == 1 else " ".join(parts)
+
+    @message.setter
+    def message(self, value: Optional[str]) -> None:
+        # Assignment replaces the whole message, as before.
+        self._message_parts = [value] if value is not None else []
+
+    def add_message(self, text: str) -> None:
+        """Append a sentence to the battle-log message."""
+        if text:
+            self._message_parts.append(text)
+
+    @property
+    def has_message(self) -> bool:
+        """True once any effect has set or appended a battle-log message."""
+        return bool(self._message_parts)
+
     @property
     def fx_tag(self) -> Optional[str]:
         """Convenience access to the skill's fx_tag."""
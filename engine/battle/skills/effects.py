@@ -1,10 +1,14 @@
 from __future__ import annotations
-import random
+from random import random as _rand
 from dataclasses import dataclass, field
-from typing import Any, Callable, List, Sequence, TYPE_CHECKING
-from engine.battle.status.effects import roll_dot_land
+from typing import Any, Callable, List, Sequence
 
-from game.debug.debug_logger import log as battle_log
+from engine.battle.damage import _get_effective_stats, compute_damage_batch
+from engine.battle.effective_combatant import EffectiveCombatant
+from engine.battle.equipment_query import get_weapon_bonus_for_user
+from engine.battle.status.effects import StatusEffect, roll_dot_land
+from engine.battle.status.status_events import StatusEvent
+from game.debug.debug_logger import is_enabled as battle_log_enabled, log as battle_log
 
 from .base import (
     SkillEffect,
@@ -13,13 +17,11 @@ from .base import (
     TargetChange,
 )
 
-if TYPE_CHECKING:
-    # Only for type-checkers; at runtime we don't require a concrete status class.
-    from engine.battle.status.effects import StatusEffect, roll_dot_land  # type: ignore[misc]
-from engine.battle.status.effects import roll_dot_land
-
 
 DamageType = str  # "physical", "magic", "mixed"
+
+# Shared stand-in for statuses without tags (read-only)
+_EMPTY_TAGS: frozenset[str] = frozenset()
 # ---------------------------------------------------------------------------
 # SkillEffect / Result contract – Forge XVII.16
 # ---------------------------------------------------------------------------
@@ -64,37 +66,58 @@ DamageType = str  # "physical", "magic", "mixed"
 # semantics without changing the basic shape of SkillResolutionResult.
 
 
+def _find_target_change(result: SkillResolutionResult, target: Any) -> TargetChange | None:
+    """Return the TargetChange entry for a given target, or None."""
+    index = result._tc_index
+    if len(index) != len(result.targets):
+        # Someone appended to result.targets directly – reindex.
+        index.clear()
+        for tc in result.targets:
+            index[id(tc.target)] = tc
+    return index.get(id(target))
+
+
 def _get_or_create_target_change(result: SkillResolutionResult, target: Any) -> TargetChange:
     """Find or create the TargetChange entry for a given target."""
-    for tc in result.targets:
-        if tc.target is target:
-            return tc
-    tc = TargetChange(target=target)
-    result.targets.append(tc)
+    tc = _find_target_change(result, target)
+    if tc is None:
+        tc = TargetChange(target=target)
+        result.targets.append(tc)
+        result._tc_index[id(target)] = tc
     return tc
 
 
 # ---------------------------------------------------------------------------
 # Core mechanical effects
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChanceStatusEffect(SkillEffect):
     status_factory: Callable[[Any, Any, Any], "StatusEffect"]
     chance: float = 1.0
 
-    def apply(self, user, targets, battle_state, result):
+    # chance clamped to [0, 1] once, in __post_init__; a guaranteed
+    # proc (p == 1) skips the RNG roll entirely.
+    _p: float = field(default=1.0, init=False, repr=False, compare=False)
+    _always: bool = field(default=True, init=False, repr=False, compare=False)
+
+    # SkillResolver only passes live targets.
+    target_mode = "alive"
+
+    def __post_init__(self) -> None:
         p = max(0.0, min(1.0, float(self.chance)))
+        object.__setattr__(self, "_p", p)
+        object.__setattr__(self, "_always", p >= 1.0)
+
+    def apply(self, user, targets, battle_state, result):
+        p = self._p
         if p <= 0.0:
             return
+        always = self._always
 
-        triggered_any = False
         proc_names: list[str] = []
 
         for t in targets:
-            if hasattr(t, "hp") and getattr(t, "hp") <= 0:
-                continue
-
-            if random.random() >= p:
+            if not always and _rand() >= p:
                 continue
 
             status_mgr = getattr(t, "status", None)
@@ -104,18 +127,13 @@ class ChanceStatusEffect(SkillEffect):
             status = self.status_factory(user, t, battle_state)
             status_mgr.add(status, context=battle_state)
 
-            tc = _get_or_create_target_change(result, t)
-            tc.status_applied.append(status.id)
-
-            triggered_any = True
+            _get_or_create_target_change(result, t).status_applied.append(status.id)
             proc_names.append(getattr(status, "name", status.id))
 
-        if triggered_any:
-            base_msg = result.message or ""
-            extra = " " + " ".join(f"{name} takes hold!" for name in proc_names)
-            result.message = (base_msg + extra).strip()
+        if proc_names:
+            result.add_message(" ".join([f"{name} takes hold!" for name in proc_names]))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DamageEffect(SkillEffect):
     """
     Basic damage effect.
@@ -145,43 +163,54 @@ class DamageEffect(SkillEffect):
     scaling: str | None = None   # "atk" or "mag"
     coeff: float = 1.0
 
-    def compute_base_damage(self, user: Any, target: Any, battle_state: Any) -> int:
-        """
-        Compute the base_damage BEFORE defenses/variance.
+    # Resolved once in __post_init__ (skill configs don't change after
+    # registration): either a scaling callable over EffectiveStats, or
+    # None with the constant result in _flat_base.
+    _scale: Callable[[Any], int] | None = field(default=None, init=False, repr=False, compare=False)
+    _flat_base: int = field(default=1, init=False, repr=False, compare=False)
 
-        Priority:
-          1) If scaling is set ("atk" or "mag"), use effective stat * coeff (+ power).
-          2) Else if mag_ratio is set, use effective MAG * mag_ratio (+ power).
-          3) Else use the fixed power value.
-        """
-        from engine.battle.damage import _get_effective_stats
+    # SkillResolver only passes live targets; HP is written directly.
+    target_mode = "alive"
+    alters_hp = True
+    deals_damage = True
 
-        eff = _get_effective_stats(user)
-        base = 0.0
+    def __post_init__(self) -> None:
+        flat = float(self.base_damage or 0)
+        scale: Callable[[Any], int] | None
+        flat_base = 1
 
         # --- 1) Explicit scaling path (preferred) ---
         if self.scaling == "atk":
-            stat_val = eff["atk"]
-            base = stat_val * float(self.coeff)
+            coeff = float(self.coeff)
+            scale = lambda eff: max(1, int(eff.atk * coeff + flat))
         elif self.scaling == "mag":
-            stat_val = eff["mag"]
-            base = stat_val * float(self.coeff)
+            coeff = float(self.coeff)
+            scale = lambda eff: max(1, int(eff.mag * coeff + flat))
+        # --- 2) Legacy MAG scaling path ---
+        elif self.scaling is None and self.mag_ratio is not None:
+            ratio = float(self.mag_ratio)
+            scale = lambda eff: max(1, int(eff.mag * ratio + flat))
+        # --- 3) Pure flat power (also unknown scaling kinds): int math only ---
         else:
-            stat_val = 0  # for clarity
+            scale = None
+            flat_base = max(1, int(self.base_damage or 0))
 
-        if self.scaling is not None:
-            base += float(self.base_damage or 0)
-            return max(1, int(base))
+        object.__setattr__(self, "_scale", scale)
+        object.__setattr__(self, "_flat_base", flat_base)
 
-        # --- 2) Legacy MAG scaling path ---
-        if self.mag_ratio is not None:
-            mag_val = eff["mag"]
-            base = mag_val * float(self.mag_ratio)
-            base += float(self.base_damage or 0)
-            return max(1, int(base))
+    def compute_base_damage(self, user: Any, target: Any, battle_state: Any) -> int:
+        """
+        Compute the base_damage BEFORE defenses/variance.
 
-        # --- 3) Pure flat power ---
-        return max(1, int(self.base_damage))
+        Priority:
+          1) If scaling is set ("atk" or "mag"), use effective stat * coeff (+ power).
+          2) Else if mag_ratio is set, use effective MAG * mag_ratio (+ power).
+          3) Else use the fixed power value.
+        """
+        scale = self._scale
+        if scale is None:
+            return self._flat_base
+        return scale(_get_effective_stats(user))
 
     def apply(
         self,
@@ -195,8 +224,8 @@ class DamageEffect(SkillEffect):
 
         Forge XVII.18c flow:
 
-          1) compute_base_damage() → pre-defense base_damage
-          2) compute_damage() → apply DEF/MRES + variance → raw
+          1) compute_base_damage() → pre-defense base_damage (once per apply)
+          2) compute_damage_batch() → apply DEF/MRES + variance → raw per target
           3) StatusManager.apply_incoming_damage_modifiers() →
              shields, Fire Shield reflect, bonus heals, retaliation events
           4) Apply final HP changes directly to the target
@@ -205,48 +234,59 @@ class DamageEffect(SkillEffect):
 
         battle_state is the BattleController.
         """
-        from engine.battle.damage import compute_damage
-        from game.debug.debug_logger import log as battle_log
+        # battle_state collaborators (and the user) don't change across
+        # targets: resolve the FX hook and log sink once per call.
+        runtime = getattr(battle_state, "runtime", None)
+        emit_hit_fx = getattr(runtime, "emit_basic_hit_fx", None)
+        arena = getattr(battle_state, "arena", None)
+        dbg_runtime = getattr(getattr(battle_state, "debug", None), "runtime", None)
+        user_is_enemy = getattr(user, "is_enemy", False)
+
+        # Damage-pipeline context, shared by every target (statuses only read it)
+        ctx = {
+            "attacker": user,
+            "battle_state": battle_state,
+        }
+
+        # SkillResolver already filtered out dead/KO targets (target_mode)
+        live = targets
+        if not live:
+            return
 
-        for t in targets:
-            # Skip dead/KO targets
-            if hasattr(t, "hp") and getattr(t, "hp") <= 0:
+        # Attacker side is the same for every target: weapon bonus and the
+        # pre-defense base_damage are resolved once for the whole batch.
+        bonus = get_weapon_bonus_for_user(user, battle_state)
+        eff_user = EffectiveCombatant(
+            base=user,
+            atk_bonus=bonus.atk_bonus,
+            mag_bonus=bonus.mag_bonus,
+        )
+
+        # 1) Pre-defense base_damage from EFFECTIVE user stats + skill scaling
+        base_damage = self.compute_base_damage(eff_user, live[0], battle_state)
+
+        # 2) Shared damage model: DEF/MRES + variance, one roll per target
+        rolls = compute_damage_batch(
+            eff_user,
+            live,
+            element=self.element,
+            base_damage=base_damage,
+            damage_type=self.damage_type,
+        )
+
+        for t, (base, breakdown) in zip(live, rolls):
+            hp = getattr(t, "hp", None)
+            if hp is not None and hp <= 0:
+                # Listed twice and already KO'd by the earlier hit
                 continue
-            from engine.battle.effective_combatant import EffectiveCombatant
-            from engine.battle.equipment_query import get_weapon_bonus_for_user
-
-            bonus = get_weapon_bonus_for_user(user, battle_state)
-            eff_user = EffectiveCombatant(
-                base=user,
-                atk_bonus=bonus.atk_bonus,
-                mag_bonus=bonus.mag_bonus,
-            )
-
-            # 1) Pre-defense base_damage from EFFECTIVE user stats + skill scaling
-            base_damage = self.compute_base_damage(eff_user, t, battle_state)
-
-            # 2) Shared damage model: DEF/MRES + variance (also uses effective stats)
-            base, breakdown = compute_damage(
-                attacker=eff_user,
-                defender=t,
-                element=self.element,
-                base_damage=base_damage,
-                damage_type=self.damage_type,
-            )
 
             # 3) Status pipeline (Fire Shield, barriers, reflect, etc.)
             status_mgr = getattr(t, "status", None)
             modified = base
             bonus_heal = 0
-            from engine.battle.status.status_events import StatusEvent
             retaliation_events: list[StatusEvent] = []
 
-
             if status_mgr is not None:
-                ctx = {
-                    "attacker": user,
-                    "battle_state": battle_state,
-                }
                 modified, bonus_heal, retaliation_events = status_mgr.apply_incoming_damage_modifiers(
                     amount=base,
                     element=self.element,
@@ -258,24 +298,27 @@ class DamageEffect(SkillEffect):
             before_hp = getattr(t, "hp", None)
 
             if modified > 0:
-                if hasattr(t, "take_damage"):
-                    t.take_damage(modified)
-                elif hasattr(t, "hp"):
+                take_damage = getattr(t, "take_damage", None)
+                if take_damage is not None:
+                    take_damage(modified)
+                elif hp is not None:
                     t.hp = max(0, int(t.hp) - int(modified))
 
             if bonus_heal > 0:
-                if hasattr(t, "heal"):
-                    t.heal(bonus_heal)
-                elif hasattr(t, "hp") and hasattr(t, "max_hp"):
-                    t.hp = min(int(t.max_hp), int(t.hp) + int(bonus_heal))
+                heal = getattr(t, "heal", None)
+                if heal is not None:
+                    heal(bonus_heal)
+                else:
+                    max_hp = getattr(t, "max_hp", None)
+                    if hp is not None and max_hp is not None:
+                        t.hp = min(int(max_hp), int(t.hp) + int(bonus_heal))
 
             after_hp = getattr(t, "hp", None)
 
             # 5) Emit FX via Runtime (optional, safe if missing)
-            runtime = getattr(battle_state, "runtime", None)
-            if runtime is not None and hasattr(runtime, "emit_basic_hit_fx") and modified > 0:
+            if emit_hit_fx is not None and modified > 0:
                 try:
-                    runtime.emit_basic_hit_fx(
+                    emit_hit_fx(
                         source=user,
                         target=t,
                         damage=modified,
@@ -285,8 +328,8 @@ class DamageEffect(SkillEffect):
                             and before_hp > 0
                             and after_hp == 0
                         ),
-                        is_enemy=getattr(user, "is_enemy", False),
-                        arena=getattr(battle_state, "arena", None),
+                        is_enemy=user_is_enemy,
+                        arena=arena,
                     )
                 except Exception:
                     # FX failures shouldn't break the battle
@@ -302,21 +345,21 @@ class DamageEffect(SkillEffect):
             if retaliation_events:
                 result.status_events.extend(retaliation_events)
 
-            # 8) Logging
-            dbg = getattr(battle_state, "debug", None)
-            msg = (
-                f"[BATTLE SKILL] [DMG] {getattr(user, 'name', '?')} "
-                f"-> {getattr(t, 'name', '?')} "
-                f"| type={self.damage_type}, element={self.element} "
-                f"| base_damage={base_damage}, raw={base}, "
-                f"final={modified}, bonus_heal={bonus_heal}"
-            )
-            if dbg is not None and hasattr(dbg, "runtime"):
-                dbg.runtime(msg)
-            else:
-                battle_log("skill", msg)
-
-@dataclass
+            # 8) Logging (only format when someone is listening)
+            if dbg_runtime is not None or battle_log_enabled("skill"):
+                msg = (
+                    f"[BATTLE SKILL] [DMG] {getattr(user, 'name', '?')} "
+                    f"-> {getattr(t, 'name', '?')} "
+                    f"| type={self.damage_type}, element={self.element} "
+                    f"| base_damage={base_damage}, raw={base}, "
+                    f"final={modified}, bonus_heal={bonus_heal}"
+                )
+                if dbg_runtime is not None:
+                    dbg_runtime(msg)
+                else:
+                    battle_log("skill", msg)
+
+@dataclass(slots=True, frozen=True)
 class HealEffect(SkillEffect):
     """
     Simple healing effect.
@@ -330,6 +373,10 @@ class HealEffect(SkillEffect):
     # Whether to clamp heal so we don't heal dead targets (can be changed later).
     skip_if_dead: bool = True
 
+    @property
+    def target_mode(self) -> str:
+        return "alive" if self.skip_if_dead else "any"
+
     def compute_heal_amount(self, user: Any, target: Any, battle_state: Any) -> int:
         # TODO: later, include scaling by MAG or healing power.
         return max(0, self.base_heal)
@@ -341,11 +388,8 @@ class HealEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
+        # Life-state check happens in SkillResolver (target_mode)
         for t in targets:
-            # Basic life-state check
-            if self.skip_if_dead and hasattr(t, "hp") and getattr(t, "hp") <= 0:
-                continue
-
             amt = self.compute_heal_amount(user, t, battle_state)
             if amt <= 0:
                 continue
@@ -354,7 +398,7 @@ class HealEffect(SkillEffect):
             tc = _get_or_create_target_change(result, t)
             tc.healed += int(amt)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MPDeltaEffect(SkillEffect):
     """
     Adjusts MP for targets (or for the user).
@@ -369,6 +413,10 @@ class MPDeltaEffect(SkillEffect):
     mp_delta: int
     apply_to_user: bool = False
 
+    def __post_init__(self) -> None:
+        # Coerce config once so apply() does no per-target casting.
+        object.__setattr__(self, "mp_delta", int(self.mp_delta))
+
     def apply(
         self,
         user: Any,
@@ -376,23 +424,28 @@ class MPDeltaEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
-        actual_targets = [user] if self.apply_to_user else list(targets)
+        mp_delta = self.mp_delta
+        if mp_delta == 0:
+            return
+
+        actual_targets = (user,) if self.apply_to_user else targets
         for t in actual_targets:
-            if not hasattr(t, "mp") or not hasattr(t, "max_mp"):
+            before = getattr(t, "mp", None)
+            max_mp = getattr(t, "max_mp", None)
+            if before is None or max_mp is None:
                 continue
 
-            before = t.mp
             # Compute clamped MP after this effect, but don't apply it yet.
-            after = max(0, min(t.max_mp, t.mp + self.mp_delta))
+            after = max(0, min(max_mp, before + mp_delta))
             delta = after - before
 
             if delta == 0:
                 continue
 
             tc = _get_or_create_target_change(result, t)
-            tc.mp_delta += int(delta)
+            tc.mp_delta += delta
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApplyStatusEffect(SkillEffect):
     """
     Applies a status effect to each target.
@@ -425,7 +478,7 @@ class ApplyStatusEffect(SkillEffect):
             if status is None:
                 continue
 
-            tags = getattr(status, "tags", None) or set()
+            tags = getattr(status, "tags", None) or _EMPTY_TAGS
             status_id = getattr(status, "id", "") or ""
             damage_type = getattr(status, "dot_damage_type", None)
 
@@ -469,7 +522,7 @@ class ApplyStatusEffect(SkillEffect):
             tc = _get_or_create_target_change(result, t)
             tc.status_applied.append(status.id)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApplyStatusToUserEffect(SkillEffect):
     """
     Applies a status to the *user* of the skill (self-buffs like Flow I).
@@ -494,7 +547,7 @@ class ApplyStatusToUserEffect(SkillEffect):
         tc = _get_or_create_target_change(result, user)
         tc.status_applied.append(status.id)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChanceStatusOnHitEffect(SkillEffect):
     """
     Applies a status effect to each target with a given probability,
@@ -514,6 +567,14 @@ class ChanceStatusOnHitEffect(SkillEffect):
     chance: float
     status_factory: Callable[[Any, Any, Any], "StatusEffect"]  # type: ignore[name-defined]
 
+    # Resolved once: never procs / always procs (no RNG roll needed)
+    _never: bool = field(default=False, init=False, repr=False, compare=False)
+    _always: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_never", self.chance <= 0.0)
+        object.__setattr__(self, "_always", self.chance >= 1.0)
+
     def apply(
         self,
         user: Any,
@@ -521,23 +582,34 @@ class ChanceStatusOnHitEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
-        from random import random
+        if self._never:
+            return
+        always = self._always
+
+        # Build a DOT-friendly / general context once for every target:
+        # - attacker: who applied the status (for snapshot damage, etc.)
+        # - runtime/arena: optional, for FX hooks.
+        ctx: dict[str, object] = {"attacker": user}
+
+        runtime = getattr(battle_state, "runtime", None)
+        arena = getattr(battle_state, "arena", None)
+
+        if runtime is not None:
+            ctx["runtime"] = runtime
+        if arena is not None:
+            ctx["arena"] = arena
 
         for t in targets:
             # Find existing TargetChange (if any). We only want to proc on
             # targets that actually took damage earlier in this skill.
-            tc = None
-            for existing in result.targets:
-                if existing.target is t:
-                    tc = existing
-                    break
+            tc = _find_target_change(result, t)
 
             # If no TargetChange yet, or no damage, we skip.
             if tc is None or tc.damage <= 0:
                 continue
 
             # Roll the per-target proc chance.
-            if random() >= self.chance:
+            if not always and _rand() >= self.chance:
                 continue
 
             status_mgr = getattr(t, "status", None)
@@ -549,26 +621,13 @@ class ChanceStatusOnHitEffect(SkillEffect):
             if status is None:
                 continue
 
-            # Build a DOT-friendly / general context:
-            # - attacker: who applied the status (for snapshot damage, etc.)
-            # - runtime/arena: optional, for FX hooks.
-            ctx: dict[str, object] = {"attacker": user}
-
-            runtime = getattr(battle_state, "runtime", None)
-            arena = getattr(battle_state, "arena", None)
-
-            if runtime is not None:
-                ctx["runtime"] = runtime
-            if arena is not None:
-                ctx["arena"] = arena
-
             status_mgr.add(status, context=ctx)
 
             # Record in SkillResolutionResult so FX / logs can see it.
             tc.status_applied.append(status.id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RemoveStatusByIdEffect(SkillEffect):
     """
     Removes specific statuses by id (exact match).
@@ -578,6 +637,12 @@ class RemoveStatusByIdEffect(SkillEffect):
 
     status_ids: List[str] = field(default_factory=list)
 
+    # Hashed copy of status_ids for membership tests
+    _status_ids: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_status_ids", frozenset(self.status_ids))
+
     def apply(
         self,
         user: Any,
@@ -585,23 +650,25 @@ class RemoveStatusByIdEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
+        status_ids = self._status_ids
+
+        def matches(e: Any) -> bool:
+            return e.id in status_ids
+
         for t in targets:
             status_mgr = getattr(t, "status", None)
             if status_mgr is None:
                 continue
 
-            removed_ids: List[str] = []
-            for e in list(status_mgr.effects):
-                if e.id in self.status_ids:
-                    removed_ids.append(e.id)
-                    status_mgr.remove(e, context=battle_state)
+            removed = status_mgr.remove_where(matches, context=battle_state)
+            removed_ids = [e.id for e in removed]
 
             if removed_ids:
                 tc = _get_or_create_target_change(result, t)
                 tc.status_removed.extend(removed_ids)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RemoveStatusByTagEffect(SkillEffect):
     """
     Removes statuses that contain any of the given tags.
@@ -610,7 +677,7 @@ class RemoveStatusByTagEffect(SkillEffect):
         tags={"poison", "shadow_slow"}
     """
 
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = field(default_factory=frozenset)
 
     def apply(
         self,
@@ -619,23 +686,25 @@ class RemoveStatusByTagEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
+        tags = self.tags
+
+        def matches(e: Any) -> bool:
+            return not tags.isdisjoint(e.tags)
+
         for t in targets:
             status_mgr = getattr(t, "status", None)
             if status_mgr is None:
                 continue
 
-            removed_ids: List[str] = []
-            for e in list(status_mgr.effects):
-                if self.tags.intersection(e.tags):
-                    removed_ids.append(e.id)
-                    status_mgr.remove(e, context=battle_state)
+            removed = status_mgr.remove_where(matches, context=battle_state)
+            removed_ids = [e.id for e in removed]
 
             if removed_ids:
                 tc = _get_or_create_target_change(result, t)
                 tc.status_removed.extend(removed_ids)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviveEffect(SkillEffect):
     """
     Revives KO'd allies.
@@ -647,6 +716,13 @@ class ReviveEffect(SkillEffect):
 
     heal_amount: int
 
+    # SkillResolver only passes KO'd targets; HP is written directly.
+    target_mode = "dead"
+    alters_hp = True
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "heal_amount", int(self.heal_amount))
+
     def apply(
         self,
         user: Any,
@@ -654,16 +730,19 @@ class ReviveEffect(SkillEffect):
         battle_state: Any,
         result: SkillResolutionResult,
     ) -> None:
+        heal_amount = self.heal_amount
         for t in targets:
-            if not hasattr(t, "hp") or not hasattr(t, "max_hp"):
+            hp = getattr(t, "hp", None)
+            max_hp = getattr(t, "max_hp", None)
+            if hp is None or max_hp is None:
                 continue
 
-            if getattr(t, "hp") > 0:
-                # Not dead, nothing to revive.
+            if hp > 0:
+                # Listed twice and already revived by the earlier entry
                 continue
 
             # Basic revive: set HP to heal_amount, clamped to max_hp.
-            new_hp = max(1, min(t.max_hp, self.heal_amount))
+            new_hp = max(1, min(max_hp, heal_amount))
             t.hp = new_hp
 
             tc = _get_or_create_target_change(result, t)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Iterable
+from typing import Callable, Dict, Iterable, NamedTuple
 
 from .base import SkillMeta, SkillDefinition
 from .effects import DamageEffect, ApplyStatusEffect, ChanceStatusEffect
@@ -16,25 +16,43 @@ RegisterFn = Callable[[SkillDefinition], None]
 
 # Only our core trio should ever see Elemental skills
 ELEMENTAL_USERS: Iterable[str] = ("Setia", "Nyra", "Kaira")
+# (display name, lowercase id prefix) pairs, lowered once at import
+_ELEMENTAL_USER_PAIRS: tuple[tuple[str, str], ...] = tuple(
+    (user, user.lower()) for user in ELEMENTAL_USERS
+)
 # ---------------------------------------------------------------------------
 # Burn DoT tiers (elemental fire status source-of-truth)
 # ---------------------------------------------------------------------------
 
+class BurnTierCfg(NamedTuple):
+    """Tuning for one Burn tier (read via attributes on the proc path)."""
+    id: str
+    name: str
+    duration: int
+    # This scalar plugs into DotStatus.compute_base_total →
+    # engine.battle.damage.mitigate(base_damage=...)
+    power_scalar: float
+    stackable: bool
+
+
+_BURN_T1 = BurnTierCfg(
+    id="burn_1",
+    name="Burn I",
+    duration=3,
+    power_scalar=0.8,
+    stackable=True,
+)
+
+# Tags every Burn instance carries (DOT pipeline + FX)
+_BURN_TAGS: frozenset[str] = frozenset({"burn", "dot", "fire", "debuff"})
+
 # In XVII.9d we start with a single tier (Burn I), but this structure is
 # ready for Burn II / III, etc.
-BURN_TIERS = {
-    "burn_1": {
-        "id": "burn_1",
-        "name": "Burn I",
-        "duration": 3,
-        # This scalar plugs into DotStatus.compute_base_total →
-        # engine.battle.damage.compute_damage(base_damage=...)
-        "power_scalar": 0.8,
-        "stackable": True,
-    },
+BURN_TIERS: Dict[str, BurnTierCfg] = {
+    "burn_1": _BURN_T1,
     # Future:
-    # "burn_2": {...},
-    # "burn_3": {...},
+    # "burn_2": BurnTierCfg(...),
+    # "burn_3": BurnTierCfg(...),
 }
 
 def make_burn_t1(user, target, battle_state):
@@ -45,24 +63,22 @@ def make_burn_t1(user, target, battle_state):
     engine, but with all tuning (duration, power, stack behavior) defined
     here in elemental.py.
     """
-    cfg = BURN_TIERS["burn_1"]
+    cfg = _BURN_T1
 
     status = BurnStatus(
-        id=cfg["id"],
-        name=cfg["name"],
-        duration_turns=cfg["duration"],
+        id=cfg.id,
+        name=cfg.name,
+        duration_turns=cfg.duration,
         dispellable=True,
-        stackable=cfg["stackable"],
+        stackable=cfg.stackable,
     )
 
     # Tier-specific tuning: adjust the power scalar per tier if desired.
-    status.base_power_scalar = cfg["power_scalar"]
+    status.base_power_scalar = cfg.power_scalar
 
     # Ensure tags are consistent with the DOT pipeline and FX system
-    if not hasattr(status, "tags") or status.tags is None:
-        status.tags = set()
-
-    status.tags.update({"burn", "dot", "fire", "debuff"})
+    # (StatusEffect always initialises its own tags set)
+    status.tags |= _BURN_TAGS
     status.icon_type = "debuff"   # or "dot"
     status.icon_id = "burn"
     return status
@@ -84,10 +100,17 @@ def _register_shield_for_core_users(
 ) -> None:
     """
     Register a single-target elemental shield for Setia, Nyra, and Kaira.
+
+    The effects tuple is built once and shared by every per-user variant
+    (effects are frozen and definitions are read-only once registered).
     """
-    for user in ELEMENTAL_USERS:
+    shared_effects = (
+        ApplyStatusEffect(status_factory=status_factory),
+    )
+
+    for user, user_lc in _ELEMENTAL_USER_PAIRS:
         meta = SkillMeta(
-            id=f"{user.lower()}_{base_id}",
+            id=f"{user_lc}_{base_id}",
             name=display_name,
             user=user,
             category="buff",
@@ -96,19 +119,12 @@ def _register_shield_for_core_users(
             mp_cost=mp_cost,
             target_type="ally_single",
             description=description,
-            tags={"elemental", "shield", element, user.lower()},
+            tags={"elemental", "shield", element, user_lc},
             fx_tag=fx_tag,
             menu_group="elemental",
         )
 
-        skill_def = SkillDefinition(
-            meta=meta,
-            effects=[
-                ApplyStatusEffect(status_factory=status_factory),
-            ],
-        )
-
-        register(skill_def)
+        register(SkillDefinition(meta=meta, effects=shared_effects))
 
 
 def _register_elemental_spell_for_core_users(
@@ -129,10 +145,29 @@ def _register_elemental_spell_for_core_users(
     for Setia, Nyra, and Kaira.
 
     Damage is MAG-scaled via mag_ratio, with an optional on-hit status proc.
+    The effects tuple is shared by every per-user variant.
     """
-    for user in ELEMENTAL_USERS:
+    shared_effects = (
+        # MAG-based elemental damage
+        DamageEffect(
+            base_damage=0,
+            element=element,
+            mag_ratio=mag_ratio,
+        ),
+    )
+
+    # Optional Burn / Frostbite proc
+    if status_factory is not None and status_chance > 0.0:
+        shared_effects += (
+            ChanceStatusEffect(
+                status_factory=status_factory,
+                chance=status_chance,
+            ),
+        )
+
+    for user, user_lc in _ELEMENTAL_USER_PAIRS:
         meta = SkillMeta(
-            id=f"{user.lower()}_{base_id}",
+            id=f"{user_lc}_{base_id}",
             name=display_name,
             user=user,
             category="damage",
@@ -141,31 +176,12 @@ def _register_elemental_spell_for_core_users(
             mp_cost=mp_cost,
             target_type="enemy_single",
             description=description,
-            tags={"elemental", "spell", element, user.lower()},
+            tags={"elemental", "spell", element, user_lc},
             fx_tag=fx_tag,
             menu_group="elemental",
         )
 
-        effects = [
-            # MAG-based elemental damage
-            DamageEffect(
-                base_damage=0,
-                element=element,
-                mag_ratio=mag_ratio,
-            ),
-        ]
-
-        # Optional Burn / Frostbite proc
-        if status_factory is not None and status_chance > 0.0:
-            effects.append(
-                ChanceStatusEffect(
-                    status_factory=status_factory,
-                    chance=status_chance,
-                )
-            )
-
-        skill_def = SkillDefinition(meta=meta, effects=effects)
-        register(skill_def)
+        register(SkillDefinition(meta=meta, effects=shared_effects))
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,41 @@ from engine.battle.status.effects import (
     BurnStatus,
 )
 
+# Tags added to every Bleed / Poison instance (new system uses tags for detection)
+_BLEED_TAGS: frozenset[str] = frozenset({"bleed", "dot", "debuff"})
+_POISON_TAGS: frozenset[str] = frozenset({"poison", "dot", "debuff"})
+
+
+# Status factories live at module scope so each ApplyStatusEffect holds a
+# single shared function instead of a closure rebuilt per registration.
+def _bleed_factory(user, target, battle_state):
+    # Tier-ready duration: T1 = 2 turns
+    duration = 2
+    status = BleedStatus(
+        id="bleed",
+        name="Bleed I",
+        duration_turns=duration,
+    )
+    # Add DOT tags (new system uses tags for detection)
+    status.tags |= _BLEED_TAGS
+    status.icon_type = "dot"
+    status.icon_id = "bleed"
+    return status
+
+
+def _poison_factory(user, target, battle_state):
+    # Tier-ready duration: T1 = 4 turns
+    duration = 4
+    status = PoisonStatus(
+        id="poison",
+        name="Poison I",
+        duration_turns=duration,
+    )
+    status.tags |= _POISON_TAGS
+    status.icon_type = "dot"
+    status.icon_id = "poison"
+    return status
+
 
 def register_kaira_skills(register_fn):
     """
@@ -37,9 +72,9 @@ def register_kaira_skills(register_fn):
 
     attack_def = SkillDefinition(
         meta=meta_attack,
-        effects=[
-            DamageEffect(base_damage=10, element="shadow")
-        ],
+        effects=(
+            DamageEffect(base_damage=10, element="shadow"),
+        ),
     )
     register_fn(attack_def)
 
@@ -61,26 +96,12 @@ def register_kaira_skills(register_fn):
         menu_group="arts",
     )
 
-    def bleed_factory(user, target, battle_state):
-        # Tier-ready duration: T1 = 2 turns
-        duration = 2
-        status = BleedStatus(
-            id="bleed",
-            name="Bleed I",
-            duration_turns=duration,
-        )
-        # Add DOT tags (new system uses tags for detection)
-        status.tags.update({"bleed", "dot", "debuff"})
-        status.icon_type = "dot"
-        status.icon_id = "bleed"
-        return status
-
     blood_cut_def = SkillDefinition(
         meta=meta_blood_cut,
-        effects=[
+        effects=(
             # No DamageEffect here — pure DoT application
-            ApplyStatusEffect(bleed_factory),
-        ],
+            ApplyStatusEffect(_bleed_factory),
+        ),
     )
     register_fn(blood_cut_def)
 
@@ -102,25 +123,12 @@ def register_kaira_skills(register_fn):
         menu_group="arts",
     )
 
-    def poison_factory(user, target, battle_state):
-        # Tier-ready duration: T1 = 4 turns
-        duration = 4
-        status = PoisonStatus(
-            id="poison",
-            name="Poison I",
-            duration_turns=duration,
-        )
-        status.tags.update({"poison", "dot", "debuff"})
-        status.icon_type = "dot"
-        status.icon_id = "poison"
-        return status
-
     poison_dagger_def = SkillDefinition(
         meta=meta_poison_dagger,
-        effects=[
+        effects=(
             # again, DoT only — no direct damage component
-            ApplyStatusEffect(poison_factory),
-        ],
+            ApplyStatusEffect(_poison_factory),
+        ),
     )
     register_fn(poison_dagger_def)
 
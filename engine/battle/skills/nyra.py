@@ -24,7 +24,7 @@ def register_nyra_skills(register_fn):
 
     attack_def = SkillDefinition(
         meta=meta_attack,
-        effects=[DamageEffect(base_damage=10, element="physical")],
+        effects=(DamageEffect(base_damage=10, element="physical"),),
     )
 
     register_fn(attack_def)
@@ -50,7 +50,7 @@ def register_nyra_skills(register_fn):
 
     first_light_def = SkillDefinition(
         meta=meta_first_light,
-        effects=[HealEffect(base_heal=20)],
+        effects=(HealEffect(base_heal=20),),
     )
 
     register_fn(first_light_def)
@@ -73,20 +73,14 @@ def register_nyra_skills(register_fn):
         menu_group="arts",
     )
 
-    def blessing_def_factory(user, target, battle_state):
-        # +10% DEF for 3T (Affirmation I)
-        return make_affirmation_status(user, target, battle_state)
-
-    def blessing_regen_factory(user, target, battle_state):
-        # Regen (MAG × 0.25) for 3T (Affirmation I)
-        return make_affirmation_regen_status(user, target, battle_state)
-
     blessing_touch_def = SkillDefinition(
         meta=meta_blessing_touch,
-        effects=[
-            ApplyStatusEffect(blessing_def_factory),
-            ApplyStatusEffect(blessing_regen_factory),
-        ],
+        effects=(
+            # +10% DEF for 3T (Affirmation I)
+            ApplyStatusEffect(make_affirmation_status),
+            # Regen (MAG × 0.25) for 3T (Affirmation I)
+            ApplyStatusEffect(make_affirmation_regen_status),
+        ),
     )
 
 
@@ -12,7 +12,7 @@ It is purely logical: no pygame, no visual FX logic.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from .base import SkillMeta, SkillDefinition
 
 from .setia import register_setia_skills
@@ -21,7 +21,6 @@ from .kaira import register_kaira_skills
 from .shared import register_shared_skills
 from .elemental import register_elemental_skills   # NEW: elemental spell book
 from . import enemy_skills  # add this near the top of registry.py
-from .effects import DamageEffect  # add this near the top with other imports
 
 # ---------------------------------------------------------------------------
 # Global registry
@@ -30,14 +29,22 @@ from .effects import DamageEffect  # add this near the top with other imports
 _SKILLS: Dict[str, SkillDefinition] = {}
 _INITIALIZED: bool = False
 
+# Hard-coded for now; can later be driven by a config or Combatant flag.
+_PLAYER_USERS = frozenset({"setia", "nyra", "kaira"})
+
+# Lowercased user name -> that user's skills (get_for_user order).
+# Built on first query per user, dropped whenever the registry changes.
+_FOR_USER: Dict[str, Tuple[SkillDefinition, ...]] = {}
+
 
 def register(skill_def: SkillDefinition) -> None:
     """Register a skill in the global registry."""
-    skill_id = skill_def.meta.id
+    skill_id = skill_def.meta.id  # interned by SkillMeta
     if skill_id in _SKILLS:
         # Overwrite for now (you can tighten this later if desired).
         pass
     _SKILLS[skill_id] = skill_def
+    _FOR_USER.clear()
 
 
 def get(skill_id: str) -> SkillDefinition:
@@ -59,24 +66,21 @@ def get_for_user(user_name: str) -> List[SkillDefinition]:
     enemy_skills.py (or other enemy-specific modules).
     """
     uname = user_name.lower()
-    result: List[SkillDefinition] = []
+    cached = _FOR_USER.get(uname)
+    if cached is None:
+        cached = _FOR_USER[uname] = _collect_for_user(uname)
+    return list(cached)
 
-    # Hard-coded for now; can later be driven by a config or Combatant flag.
-    PLAYER_USERS = {"setia", "nyra", "kaira"}
 
-    if uname in PLAYER_USERS:
+def _collect_for_user(uname: str) -> Tuple[SkillDefinition, ...]:
+    """Scan the registry for get_for_user (registration order)."""
+    if uname in _PLAYER_USERS:
         # Player characters: personal + shared
-        for s in _SKILLS.values():
-            u = s.meta.user.lower()
-            if u == uname or u == "shared":
-                result.append(s)
+        wanted = (uname, "shared")
     else:
         # Enemies (and any non-player): personal only, no shared skills
-        for s in _SKILLS.values():
-            if s.meta.user.lower() == uname:
-                result.append(s)
-    
-    return result
+        wanted = (uname,)
+    return tuple(s for s in _SKILLS.values() if s.meta._user_lc in wanted)
 
 
 # ---------------------------------------------------------------------------
@@ -95,22 +99,19 @@ def initialize_defaults() -> None:
     if _INITIALIZED:
         return
 
-    # Local adapter so our per-character modules don't need to know
-    # about the global _SKILLS dict.
-    def _reg(skill_def: SkillDefinition) -> None:
-        register(skill_def)
-
+    # Per-character modules only see the register callable, never the
+    # global _SKILLS dict.
     # Order:
     #   1) Shared skills (Items, Defend, etc.)
     #   2) Elemental spells for trio
     #   3) Character-specific kits
-    register_shared_skills(_reg)
-    register_elemental_skills(_reg)
-    register_setia_skills(_reg)
-    register_nyra_skills(_reg)
-    register_kaira_skills(_reg)
+    register_shared_skills(register)
+    register_elemental_skills(register)
+    register_setia_skills(register)
+    register_nyra_skills(register)
+    register_kaira_skills(register)
     # Enemy skills
-    enemy_skills.register_enemy_basic_skills(_reg)
+    enemy_skills.register_enemy_basic_skills(register)
 
     _INITIALIZED = True
 
@@ -132,16 +133,15 @@ def debug_dump_skills() -> None:
     for skill_id, skill_def in _SKILLS.items():
         meta: SkillMeta = skill_def.meta  # ← your line, exactly
 
-        # Try to introspect base_damage / damage_type from the first DamageEffect
+        # base_damage / damage_type from the first DamageEffect (cached on the definition)
         base_damage = None
         damage_type = None
         element = getattr(meta, "element", None)
 
-        for eff in getattr(skill_def, "effects", []) or []:
-            if isinstance(eff, DamageEffect):
-                base_damage = getattr(eff, "base_damage", None)
-                damage_type = getattr(eff, "damage_type", None)
-                break
+        eff = skill_def._first_damage_effect
+        if eff is not None:
+            base_damage = getattr(eff, "base_damage", None)
+            damage_type = getattr(eff, "damage_type", None)
 
         print(f"- id: {meta.id}")
         print(f"  name: {getattr(meta, 'name', None)}")
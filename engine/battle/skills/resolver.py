@@ -11,11 +11,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any, List, Sequence, Tuple
 
 from .base import SkillDefinition, SkillResolutionResult
 
 
+def _partition_by_life(targets: Sequence[Any]) -> Tuple[List[Any], List[Any]]:
+    """Split targets into (alive, dead) for SkillEffect.target_mode."""
+    alive: List[Any] = []
+    dead: List[Any] = []
+    for t in targets:
+        hp = getattr(t, "hp", None)
+        if hp is not None and hp <= 0:
+            dead.append(t)
+        else:
+            alive.append(t)
+    return alive, dead
+
+
 class SkillResolver:
     """
     Resolves a skill into concrete changes to battle state.
@@ -49,28 +62,47 @@ class SkillResolver:
           - runs each SkillEffect
           - records what happened in a SkillResolutionResult
         """
-        # Ensure we treat targets like a list (needed for repeated passes).
-        targets = list(targets)
+        # Targets are walked once per effect, so one-shot iterables are
+        # materialised; lists/tuples from the controller are used as-is
+        # (effects only read them).
+        if not isinstance(targets, (list, tuple)):
+            targets = tuple(targets)
 
         result = SkillResolutionResult(
             skill=skill_def.meta,
             user=user,
         )
 
-        # Run each component effect in order.
-        for effect in skill_def.effects:
+        # Life-state partition of targets, built on first need and reused
+        # until an effect that writes HP (alters_hp) runs.
+        alive = dead = None
+
+        user_targets = (user,)
+
+        # Run each component effect in order (apply_to_user flags are
+        # precomputed on the frozen definition).
+        for effect, self_only in zip(skill_def.effects, skill_def._apply_to_user_mask):
             # If an effect wants to apply to the user (self-buff, self-heal, etc.),
             # we override the targets list for this effect only.
-            if getattr(effect, "apply_to_user", False):
-                actual_targets = [user]
+            if self_only:
+                actual_targets = user_targets
             else:
-                actual_targets = targets
+                mode = getattr(effect, "target_mode", "any")
+                if mode == "any":
+                    actual_targets = targets
+                else:
+                    if alive is None:
+                        alive, dead = _partition_by_life(targets)
+                    actual_targets = alive if mode == "alive" else dead
 
             effect.apply(user, actual_targets, battle_state, result)
-            
+
+            if getattr(effect, "alters_hp", False):
+                alive = dead = None
+
         # If no message has been set by any effect, generate a simple default.
-        if result.message is None:
-            user_name = getattr(user, "name", "???")
-            result.message = f"{user_name} used {skill_def.meta.name}!"
+        # (has_message avoids joining the parts just to test for emptiness.)
+        if not result.has_message:
+            result.message = f"{user.name} used {skill_def.meta.name}!"
 
         return result
@@ -10,7 +10,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, List
+from typing import Callable, Sequence
 
 from .base import SkillMeta, SkillDefinition, CategoryType, TargetType
 from .effects import HealEffect, MPDeltaEffect
@@ -25,7 +25,7 @@ def _build_item_skill(
     description: str,
     category: CategoryType,
     target_type: TargetType,
-    effects: List,
+    effects: Sequence,
     consumes_item_id: str | None = None,
     fx_tag: str = "item_use",
 ) -> SkillDefinition:
@@ -49,50 +49,47 @@ def _build_item_skill(
     return SkillDefinition(meta=meta, effects=effects)
 
 
-def register_shared_skills(register_fn: RegisterFn) -> None:
-    """
-    Register shared skills that should appear for all combatants.
-
-    In XVI.4 this is focused on basic Items. Later we can expand with:
-      - More item tiers (Hi-Potion, Mega Potion, etc.)
-      - Status cures (Antidote, Remedy) using RemoveStatus* effects
-      - Revive items using ReviveEffect
-      - Inventory-aware checks before use
-    """
-    skills: List[SkillDefinition] = []
-
+# Built once at import (definitions are frozen and safe to share).
+_SHARED_SKILLS = (
     # --------------------------------------------------
     # Potion – basic HP restore item
     # --------------------------------------------------
-    potion = _build_item_skill(
+    _build_item_skill(
         skill_id="item_potion",
         name="Potion",
         description="Restore a small amount of HP to one ally.",
         category="heal",
         target_type="ally_single",
-        effects=[HealEffect(base_heal=30)],
+        effects=(HealEffect(base_heal=30),),
         consumes_item_id="potion_small",
         fx_tag="item_heal_small",
-    )
-    skills.append(potion)
+    ),
 
     # --------------------------------------------------
     # Ether – basic MP restore item
     # --------------------------------------------------
-    ether = _build_item_skill(
+    _build_item_skill(
         skill_id="item_ether",
         name="Ether",
         description="Restore a small amount of MP to one ally.",
         category="heal",  # still a ‘heal’ category mechanically
         target_type="ally_single",
-        effects=[MPDeltaEffect(mp_delta=10)],
+        effects=(MPDeltaEffect(mp_delta=10),),
         consumes_item_id="ether_small",
         fx_tag="item_mp_small",
-    )
-    skills.append(ether)
+    ),
+)
 
-    # --------------------------------------------------
-    # Register everything with the central registry
-    # --------------------------------------------------
-    for s in skills:
+
+def register_shared_skills(register_fn: RegisterFn) -> None:
+    """
+    Register shared skills that should appear for all combatants.
+
+    In XVI.4 this is focused on basic Items. Later we can expand with:
+      - More item tiers (Hi-Potion, Mega Potion, etc.)
+      - Status cures (Antidote, Remedy) using RemoveStatus* effects
+      - Revive items using ReviveEffect
+      - Inventory-aware checks before use
+    """
+    for s in _SHARED_SKILLS:
         register_fn(s)
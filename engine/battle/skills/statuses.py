@@ -1,14 +1,15 @@
 # engine/battle/skills/statuses.py
 
 from __future__ import annotations
+from collections.abc import Mapping
 from typing import Any
-from game.debug.debug_logger import log as battle_log
 from engine.battle.status.effects import (
     RegenStatus,
     StatBuffStatus,
     IceShieldStatus,
     StatusEffect,
 )
+from engine.battle.status.status_events import ApplyStatusEvent
 
 """
 Status factories used by skill effects.
@@ -18,6 +19,45 @@ ApplyStatusEffect so that the skill effects module does not need to
 import specific status classes.
 """
 
+# ---------------------------------------------------------------------------
+# Shared, read-only factory data
+#
+# Merged into each new instance's own tags set (|=) / handed to
+# StatBuffStatus, which only reads mults/adds.
+# ---------------------------------------------------------------------------
+
+_ICE_SHIELD_TAGS = frozenset({"shield", "ice", "ice_shield", "elemental_shield", "buff"})
+_AFFIRMATION_TAGS = frozenset({"nyra", "buff", "def_up", "affirmation"})
+_AFFIRMATION_REGEN_TAGS = frozenset({"nyra", "buff", "regen", "affirmation"})
+_BURN_TAGS = frozenset({"burn", "dot", "fire", "debuff"})
+_FROSTBITE_TAGS = frozenset({"frostbite", "slow", "ice", "debuff"})
+_FLOW_TAGS = frozenset({"setia", "buff", "flow", "speed"})
+
+_AFFIRMATION_MULTS: dict[str, float] = {"def_mult": 1.10}  # +10% DEF
+_FLOW_MULTS: dict[str, float] = {"spd_mult": 1.15}         # +15% SPD
+
+# Context keys that may name the attacker, in priority order.
+_ATTACKER_KEYS = ("attacker", "source_combatant", "source")
+
+
+def _get_attacker(context: Any) -> Any:
+    """First truthy attacker entry of a mapping- or object-style context."""
+    if context is None:
+        return None
+    if isinstance(context, Mapping):
+        get = context.get
+        for key in _ATTACKER_KEYS:
+            value = get(key)
+            if value:
+                return value
+    else:
+        for key in _ATTACKER_KEYS:
+            value = getattr(context, key, None)
+            if value:
+                return value
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Custom elemental status classes (Burn I, Frostbite I)
 # ---------------------------------------------------------------------------
@@ -55,22 +95,14 @@ class FrostbiteStatus(StatusEffect):
         retaliation_events = []
 
         # Try to discover the attacker from context (supports dict or object contexts)
-        attacker = None
-        if context is not None:
-            if isinstance(context, dict):
-                attacker = context.get("attacker") or context.get("source_combatant") or context.get("source")
-            else:
-                attacker = getattr(context, "attacker", None) or getattr(context, "source_combatant", None) or getattr(context, "source", None)
+        attacker = _get_attacker(context)
 
         # Emit frostbite retaliation as a StatusEvent (no controller mutation)
         if attacker is not None:
-            from engine.battle.status.status_events import ApplyStatusEvent
-            from engine.battle.skills.statuses import make_frostbite_basic
-
             retaliation_events.append(
                 ApplyStatusEvent(
                     target=attacker,
-                    status=make_frostbite_basic(),
+                    status=make_frostbite_basic(owner, attacker, None),
                     source_combatant=owner,
                     reason="ice_shield_retaliation",
                 )
@@ -99,7 +131,7 @@ def make_iceshield_t1(user: Any, target: Any, battle_state: Any) -> StatusEffect
         retaliation_chance=1.0,
         tier=1,
     )
-    status.tags.update({"shield", "ice", "ice_shield", "elemental_shield", "buff"})
+    status.tags |= _ICE_SHIELD_TAGS
     status.icon_type = "buff"
     status.icon_id = "shield_ice"
 
@@ -121,12 +153,10 @@ def make_affirmation_status(user: Any, target: Any, battle_state: Any) -> Status
         duration_turns=3,
         dispellable=True,
         stackable=False,             # important: no stacking cheese
-        mults={"def_mult": 1.10},    # +10% DEF
-        adds={},
+        mults=_AFFIRMATION_MULTS,    # +10% DEF
     )
 
-    if hasattr(buff, "tags"):
-        buff.tags.update({"nyra", "buff", "def_up", "affirmation"})
+    buff.tags |= _AFFIRMATION_TAGS
 
     # HUD pip: use the existing 'holy_ward' pip (or whatever you mapped it to)
     buff.icon_type = "buff"
@@ -157,8 +187,7 @@ def make_affirmation_regen_status(
         heal_per_turn=heal,
     )
 
-    if hasattr(regen, "tags"):
-        regen.tags.update({"nyra", "buff", "regen", "affirmation"})
+    regen.tags |= _AFFIRMATION_REGEN_TAGS
 
     # HUD pip: basic regen pip (single char)
     regen.icon_type = "buff"
@@ -195,7 +224,7 @@ def make_burn_basic(user: Any, target: Any, battle_state: Any) -> StatusEffect:
     )
     status.tick_amount = max(0, tick)
     status.fire_vuln_mult = 1.05
-    status.tags.update({"burn", "dot", "fire", "debuff"})
+    status.tags |= _BURN_TAGS
 
     # HUD metadata
     status.icon_type = "debuff"
@@ -216,7 +245,7 @@ def make_frostbite_basic(user: Any, target: Any, battle_state: Any) -> StatusEff
     )
     status.spd_mult = 0.85       # -15% SPD
     status.ice_vuln_mult = 1.05  # +5% ice damage taken
-    status.tags.update({"frostbite", "slow", "ice", "debuff"})
+    status.tags |= _FROSTBITE_TAGS
 
     # HUD metadata
     status.icon_type = "debuff"
@@ -238,13 +267,11 @@ def make_flow_i(user: Any, target: Any, battle_state: Any) -> StatusEffect:
         duration_turns=3,
         dispellable=True,
         stackable=True,
-        mults={"spd_mult": 1.15},
-        adds={},
+        mults=_FLOW_MULTS,
     )
 
     # Tags + HUD metadata
-    if hasattr(status, "tags"):
-        status.tags.update({"setia", "buff", "flow", "speed"})
+    status.tags |= _FLOW_TAGS
 
     status.icon_type = "buff"
     status.icon_id = "flow"
@@ -1,16 +1,108 @@
 import pygame
 
+
+def _invert_rgb(surf):
+    """
+    Return a copy of `surf` with RGB inverted and per-pixel alpha kept
+    (hit-flash look). Two C-level blend passes instead of get_at/set_at.
+    """
+    inv = surf.copy()
+    # RGB -> 255 (white), alpha untouched
+    inv.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    # 255 - RGB; BLEND_RGB_* leaves the destination alpha alone
+    inv.blit(surf, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    return inv
+
+
+# ---------------------------------------------------------------------------
+# Shared frame cache
+#
+# (paths, scale, flipped, flashing) -> frame list. Surfaces are read-only
+# once cached, so every BattleSprite using the same art and scale (e.g. a
+# pack of identical enemies) shares one load / scale / invert / flip.
+# Cleared when a battle ends (clear_frame_cache) so art from past battles
+# doesn't pile up.
+# ---------------------------------------------------------------------------
+
+_FRAME_CACHE = {}
+
+
+def _load_frames(paths, scale):
+    # 1.0: no resample. Whole-number upscales (pixel art): nearest-neighbour
+    # keeps crisp pixels and skips the bilinear filter. Anything else:
+    # smoothscale as before.
+    scale = float(scale)
+    if scale == 1.0:
+        resample = None
+    elif scale.is_integer():
+        resample = pygame.transform.scale
+    else:
+        resample = pygame.transform.smoothscale
+
+    frames = []
+    for path in paths:
+        img = pygame.image.load(path).convert_alpha()
+        if resample is not None:
+            w, h = img.get_size()
+            img = resample(img, (int(w * scale), int(h * scale)))
+        frames.append(img)
+    if not frames:
+        print("WARNING: no frames loaded for BattleSprite")
+    return frames
+
+
+def _cached_frames(paths, scale, flipped=False, flashing=False):
+    key = (paths, scale, flipped, flashing)
+    frames = _FRAME_CACHE.get(key)
+    if frames is None:
+        if flipped:
+            frames = [
+                pygame.transform.flip(f, True, False)
+                for f in _cached_frames(paths, scale, False, flashing)
+            ]
+        elif flashing:
+            frames = [_invert_rgb(f) for f in _cached_frames(paths, scale)]
+        else:
+            frames = _load_frames(paths, scale)
+        _FRAME_CACHE[key] = frames
+    return frames
+
+
+def clear_frame_cache():
+    """Drop all cached sprite frames (e.g. on a scene transition)."""
+    _FRAME_CACHE.clear()
+
+
 class BattleSprite:
     """Simple looping idle animation sprite for battle actors."""
 
+    __slots__ = (
+        "x", "y", "scale", "facing",
+        "_anim_paths", "animations", "_flash_animations", "_frame_sets",
+        "current_anim", "frame_index", "frame_timer", "frame_duration",
+        "_idle_enabled", "_active_frame_count", "_idle_advances",
+        "flash_timer", "dissolve_factor",
+        "_rect_sig", "_rect",
+        "_scratch", "_scratch_src",
+    )
+
     def __init__(self, frame_paths, x, y, scale=1.0, facing="right", idle_enabled=True):
         self.x = x
         self.y = y
         self.scale = scale
         self.facing = facing  # "left" or "right"
 
-        self.animations = {
-            "idle": self._load_frames(frame_paths),
+        # Animation name -> frame paths; frames come from the shared cache
+        self._anim_paths = {"idle": tuple(frame_paths)}
+        self.animations = self._build_frame_set(False, False)
+        # Pre-inverted copies of every animation frame for the hit flash
+        # (same keys / frame order as self.animations).
+        self._flash_animations = self._build_frame_set(False, True)
+        # (flipped, flashing) -> animation dict actually drawn; left-facing
+        # sets are built on first use instead of flipping every draw.
+        self._frame_sets = {
+            (False, False): self.animations,
+            (False, True): self._flash_animations,
         }
         self.current_anim = "idle"
         self.frame_index = 0
@@ -18,6 +110,8 @@ class BattleSprite:
         self.frame_duration = 0.14  # seconds per frame
 
         # New: can this sprite play its idle animation?
+        # (setter also primes the update() fast-path fields)
+        self._active_frame_count = len(self.animations["idle"])
         self.idle_enabled = idle_enabled
 
         # New: flash timer (seconds remaining)
@@ -25,18 +119,30 @@ class BattleSprite:
         # Dissolve factor
         self.dissolve_factor = 1.0  # 1 = fully visible, 0 = gone
 
-    def _load_frames(self, paths):
-        frames = []
-        for path in paths:
-            img = pygame.image.load(path).convert_alpha()
-            w, h = img.get_size()
-            img = pygame.transform.smoothscale(
-                img, (int(w * self.scale), int(h * self.scale))
-            )
-            frames.append(img)
-        if not frames:
-            print("WARNING: no frames loaded for BattleSprite")
-        return frames
+        # Last draw rect and the (frame surface, x, y) it was built for
+        self._rect_sig = None
+        self._rect = None
+
+        # Private copy of the frame being dissolved (cached frames are
+        # shared, so their alpha is never touched) and the frame it copies
+        self._scratch = None
+        self._scratch_src = None
+
+    def _build_frame_set(self, flipped, flashing):
+        scale = self.scale
+        return {
+            name: _cached_frames(paths, scale, flipped, flashing)
+            for name, paths in self._anim_paths.items()
+        }
+
+    @property
+    def idle_enabled(self):
+        return self._idle_enabled
+
+    @idle_enabled.setter
+    def idle_enabled(self, value):
+        self._idle_enabled = value
+        self._idle_advances = bool(value) and self._active_frame_count > 1
 
     def set_animation(self, name):
         if name == self.current_anim:
@@ -45,6 +151,10 @@ class BattleSprite:
             self.current_anim = name
             self.frame_index = 0
             self.frame_timer = 0.0
+            self._active_frame_count = len(self.animations[name])
+            self._idle_advances = (
+                bool(self._idle_enabled) and self._active_frame_count > 1
+            )
 
     def trigger_flash(self, duration: float = 0.15):
         """Cause this sprite to flash bright for a short duration."""
@@ -56,14 +166,13 @@ class BattleSprite:
     
     
     def update(self, dt):
-        # Animate idle only if allowed
-        if self.idle_enabled:
-            frames = self.animations[self.current_anim]
-            if len(frames) > 1:
-                self.frame_timer += dt
-                if self.frame_timer >= self.frame_duration:
-                    self.frame_timer -= self.frame_duration
-                    self.frame_index = (self.frame_index + 1) % len(frames)
+        # Animate idle only if allowed (and there is more than one frame);
+        # both conditions are cached by idle_enabled / set_animation.
+        if self._idle_advances:
+            self.frame_timer += dt
+            if self.frame_timer >= self.frame_duration:
+                self.frame_timer -= self.frame_duration
+                self.frame_index = (self.frame_index + 1) % self._active_frame_count
 
         # Tick down flash timer
         if self.flash_timer > 0.0:
@@ -78,53 +187,52 @@ class BattleSprite:
         """
 
         # ---------------------------------------------------------
-        # 1. Get current frame
+        # 1. Dissolve fade-out: fully dissolved sprites (dead enemies
+        #    that stay in the scene) return before any frame work.
+        #    set_dissolve_factor already clamps to [0, 1].
         # ---------------------------------------------------------
-        frames = self.animations.get(self.current_anim, [])
-        if not frames:
+        dissolve = self.dissolve_factor
+        if dissolve <= 0.0:
             return
 
-        base = frames[self.frame_index]
-
-        # Facing flip
-        frame_to_draw = base
-        if self.facing == "left":
-            frame_to_draw = pygame.transform.flip(base, True, False)
-
-        rect = frame_to_draw.get_rect()
-        rect.midbottom = (int(self.x), int(self.y))
-
         # ---------------------------------------------------------
-        # 2. Dissolve fade-out
+        # 2. Get current frame
         # ---------------------------------------------------------
-        dissolve = max(0.0, min(1.0, self.dissolve_factor))
+        # Facing flip + hit flash come from cached frame sets
+        key = (self.facing == "left", self.flash_timer > 0.0)
+        frame_set = self._frame_sets.get(key)
+        if frame_set is None:
+            frame_set = self._frame_sets[key] = self._build_frame_set(*key)
 
-        # Completely invisible → skip
-        if dissolve <= 0.0:
+        frames = frame_set.get(self.current_anim, [])
+        if not frames:
             return
 
-        # Work from a copy
-        img = frame_to_draw.copy()
-
-        # ---------------------------------------------------------
-        # 3. Flash inversion (per-pixel)
-        # ---------------------------------------------------------
-        if self.flash_timer > 0.0:
-            w, h = img.get_size()
-            for ix in range(w):
-                for iy in range(h):
-                    r, g, b, a = img.get_at((ix, iy))
-                    if a == 0:
-                        continue  # don't invert fully transparent pixels
-                    img.set_at((ix, iy), (255 - r, 255 - g, 255 - b, a))
-
-        # ---------------------------------------------------------
-        # 4. Apply dissolve alpha
-        # ---------------------------------------------------------
-        if dissolve < 1.0:
-            img.set_alpha(int(255 * dissolve))
+        frame_to_draw = frames[self.frame_index]
+
+        # Rect only changes with the frame surface or integer position
+        # (flipped / inverted frames keep their source's size).
+        sig = (frame_to_draw, int(self.x), int(self.y))
+        if sig != self._rect_sig:
+            rect = frame_to_draw.get_rect()
+            rect.midbottom = (sig[1], sig[2])
+            self._rect = rect
+            self._rect_sig = sig
+        rect = self._rect
+
+        # Flip and flash inversion are already baked into frame_to_draw,
+        # so a fully visible sprite blits its cached frame as-is.
+        if dissolve >= 1.0:
+            surface.blit(frame_to_draw, rect)
+            return
 
         # ---------------------------------------------------------
-        # 5. Draw final image
+        # 3. Dissolve: alpha goes on this sprite's own copy of the
+        #    frame, re-copied only when the frame changes.
         # ---------------------------------------------------------
+        if self._scratch_src is not frame_to_draw:
+            self._scratch = frame_to_draw.copy()
+            self._scratch_src = frame_to_draw
+        img = self._scratch
+        img.set_alpha(int(255 * dissolve))
         surface.blit(img, rect)
@@ -6,7 +6,8 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 import random
 from game.debug.debug_logger import log as battle_log
-from engine.battle.status.status_events import DamageTickEvent
+from engine.battle.damage import _get_effective_stats, mitigate
+from engine.battle.status.status_events import ApplyStatusEvent, DamageTickEvent
 DamageType = str  # e.g. "physical", "magic", "mixed"
 ElementType = str  # e.g. "fire", "ice", "holy", "shadow", "wind", "none"
 
@@ -410,7 +411,7 @@ class IceShieldStatus(StatusEffect):
 
         # Frostbite retaliation event (StatusEvent, not dict)
         if attacker is not None:
-            from engine.battle.status.status_events import ApplyStatusEvent
+            # Lazy: engine.battle.skills.statuses imports this module.
             from engine.battle.skills.statuses import make_frostbite_basic
 
             battle_state = context.get("battle_state") if isinstance(context, dict) else None
@@ -503,10 +504,8 @@ class DotStatus(StatusEffect):
         Forge XVII.18c:
           - We treat base_damage as already including the attacker's effective
             ATK/MAG and this status's scalar.
-          - compute_damage then only applies defensive mitigation + variance.
+          - damage.mitigate then only applies defensive mitigation + variance.
         """
-        from engine.battle.damage import compute_damage, _get_effective_stats
-
         attacker = self.source
         defender = owner
 
@@ -517,9 +516,9 @@ class DotStatus(StatusEffect):
         if attacker is not None:
             eff = _get_effective_stats(attacker)
             if self.dot_damage_type == "magic":
-                offensive = eff["mag"]
+                offensive = eff.mag
             else:
-                offensive = eff["atk"]
+                offensive = eff.atk
 
         base_damage = offensive * float(self.base_power_scalar)
         if base_damage <= 0:
@@ -527,15 +526,15 @@ class DotStatus(StatusEffect):
             # with a permanent 1-damage DoT when attacker is unknown.
             base_damage = float(self.base_power_scalar)
 
-        base_total, breakdown = compute_damage(
-            attacker=attacker,
-            defender=defender,
-            element=self.dot_element,
-            damage_type=self.dot_damage_type,
-            base_damage=base_damage,
-        )
+        # Defensive side of compute_damage (same ±10% roll), without
+        # re-reading the attacker's stats or building a breakdown dict.
+        dfd = _get_effective_stats(defender)
+        if self.dot_damage_type == "magic":
+            defensive = dfd.mres
+        else:
+            defensive = dfd.defense
 
-        return max(0, int(base_total))
+        return max(0, mitigate(base_damage, defensive, 0.10))
 
     # -----------------------------------------------------------------
     def on_apply(self, owner, context):
@@ -575,11 +574,15 @@ class DotStatus(StatusEffect):
         mitigated = per_tick_raw - self.snapshot_def_or_mres * self.dot_potency
         self.per_tick = max(1, int(mitigated))
 
+        # %-args: only formatted if the "status" category is enabled
         battle_log(
             "status",
-            f"[DOT APPLY] {self.name} applied to {owner.name}: "
-            f"per_tick={self.per_tick}, duration={self.duration_turns}, "
-            f"from={'shield' if self.is_from_shield else 'spell'}",
+            "[DOT APPLY] %s applied to %s: per_tick=%s, duration=%s, from=%s",
+            self.name,
+            owner.name,
+            self.per_tick,
+            self.duration_turns,
+            "shield" if self.is_from_shield else "spell",
         )
         # --------------------------------------------------
         # FX hook: notify Runtime so FXSystem can react
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from typing import Any, Callable, Iterable, List, Tuple
 from game.debug.debug_logger import log as battle_log
-from engine.battle.status.effects import DotStatus
+from engine.battle.status.effects import DotStatus, StatusEffect
 from engine.battle.status.status_events import StatusEvent, ApplyStatusEvent
 
+# Shared stand-in for statuses without tags (read-only)
+_EMPTY_TAGS: frozenset[str] = frozenset()
+
 class StatusManager:
     """
     Holds and manages all StatusEffect objects applied to a single combatant.
@@ -17,6 +20,11 @@ class StatusManager:
     def __init__(self, owner: Any):
         self.owner = owner
         self.effects: List[Any] = []   # List[StatusEffect]
+        # Bumped whenever the effect list changes, so callers can cache
+        # anything derived from it (e.g. CTB's effective-SPD inverse).
+        self.version: int = 0
+        # (version, modifiers-or-None) memo for stat_modifiers()
+        self._stat_mods_memo: Tuple[int, dict[str, float] | None] = (-1, None)
 
     # --------------------------------------------------------------
     # Basic add/remove
@@ -38,7 +46,7 @@ class StatusManager:
         """
         effect_id = getattr(effect, "id", None)
         stackable = getattr(effect, "stackable", False)
-        new_tags = getattr(effect, "tags", None) or set()
+        new_tags = getattr(effect, "tags", None) or _EMPTY_TAGS
         max_stacks = getattr(effect, "max_stacks", 0)
 
         # ----------------------------------------------------------
@@ -47,7 +55,7 @@ class StatusManager:
         if "elemental_shield" in new_tags:
             remaining: list[Any] = []
             for existing in self.effects:
-                existing_tags = getattr(existing, "tags", None) or set()
+                existing_tags = getattr(existing, "tags", None) or _EMPTY_TAGS
                 if "elemental_shield" in existing_tags:
                     # Replacing an existing shield – fire its expire hook
                     existing.on_expire(self.owner, context)
@@ -102,6 +110,7 @@ class StatusManager:
         # ----------------------------------------------------------
         effect._skip_next_turn_end_decrement = True
         self.effects.append(effect)
+        self.version += 1
         dbg = getattr(context, "debug", None)
         if dbg is not None and hasattr(dbg, "runtime"):
             dbg.runtime(
@@ -119,17 +128,43 @@ class StatusManager:
         """
         if effect in self.effects:
             self.effects.remove(effect)
+            self.version += 1
             effect.on_expire(self.owner, context)
 
     def remove_by_id(self, effect_id: str, context: Any | None = None) -> None:
         """Remove every status whose .id matches effect_id."""
+        self.pop_by_id((effect_id,), context)
+
+    def pop_by_id(self, effect_ids: Iterable[str], context: Any | None = None) -> List[Any]:
+        """
+        Remove every status whose .id is in effect_ids, in a single pass.
+
+        Multi-status dispels use this instead of one remove_by_id scan per id.
+        """
+        ids = effect_ids if isinstance(effect_ids, (set, frozenset)) else set(effect_ids)
+        return self.remove_where(lambda eff: eff.id in ids, context)
+
+    def remove_where(self, pred: Callable[[Any], bool], context: Any | None = None) -> List[Any]:
+        """
+        Remove every status matching pred, in a single pass.
+
+        Removed effects get their on_expire hook (after the list has been
+        rebuilt) and are returned in their original order.
+        """
         remaining = []
+        removed = []
         for eff in self.effects:
-            if eff.id == effect_id:
-                eff.on_expire(self.owner, context)
+            if pred(eff):
+                removed.append(eff)
             else:
                 remaining.append(eff)
-        self.effects = remaining
+        if removed:
+            self.effects = remaining
+            self.version += 1
+            for eff in removed:
+                eff.on_expire(self.owner, context)
+        return removed
+
     # --------------------------------------------------------------
     # Internal helpers
     # --------------------------------------------------------------
@@ -144,7 +179,7 @@ class StatusManager:
         owner = self.owner
         owner_name = getattr(owner, "name", "<??>")
         eff_id = getattr(eff, "id", "<no-id>")
-        tags = getattr(eff, "tags", None) or set()
+        tags = getattr(eff, "tags", None) or _EMPTY_TAGS
 
         # Heuristic: tagged "dot" or with a per-tick field.
         is_dot_tag = "dot" in tags
@@ -334,6 +369,8 @@ class StatusManager:
                 eff.on_expire(self.owner, context)
             else:
                 remaining.append(eff)
+        if len(remaining) != len(self.effects):
+            self.version += 1
         self.effects = remaining
 
     # --------------------------------------------------------------
@@ -370,6 +407,34 @@ class StatusManager:
 
         return mods
 
+    def is_neutral(self) -> bool:
+        """
+        True when no active status can change stats.
+
+        Statuses that keep StatusEffect's no-op modify_stat_modifiers()
+        (or don't define one at all) are skipped, so callers can bypass
+        get_stat_modifiers() and use base stats unchanged.
+        """
+        for eff in self.effects:
+            hook = getattr(type(eff), "modify_stat_modifiers", None)
+            if hook is not None and hook is not StatusEffect.modify_stat_modifiers:
+                return False
+        return True
+
+    def stat_modifiers(self) -> dict[str, float] | None:
+        """
+        Memoized get_stat_modifiers(): None when is_neutral(), else the
+        aggregated modifier dict (shared – treat as read-only).
+
+        Stat hooks only read immutable status config, so the result is
+        reused until the effect list changes (i.e. until version moves).
+        """
+        version, mods = self._stat_mods_memo
+        if version != self.version:
+            mods = None if self.is_neutral() else self.get_stat_modifiers()
+            self._stat_mods_memo = (self.version, mods)
+        return mods
+
     # --------------------------------------------------------------
     # Utility for debugging / HUD
     # --------------------------------------------------------------
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Optional
 
 
@@ -39,9 +40,14 @@ def register_item(defn: ItemDef) -> None:
     if defn.id in _ITEMS:
         return  # idempotent
     _ITEMS[defn.id] = defn
+    # Drop cached misses so the new id becomes visible.
+    get_item.cache_clear()
 
 
+@lru_cache(maxsize=512)
 def get_item(item_id: str) -> ItemDef | None:
+    # Item defs are immutable and never overwritten (register is idempotent),
+    # so lookups are safe to memoize; register_item() clears cached misses.
     return _ITEMS.get(item_id)
 
 
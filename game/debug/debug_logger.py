@@ -30,11 +30,23 @@ def set_categories(cats: Iterable[str]) -> None:
     global ENABLED_CATEGORIES
     ENABLED_CATEGORIES = set(cats)
 
-def log(category: str, message: str) -> None:
+def is_enabled(category: str) -> bool:
+    """True if log(category, ...) would print; lets hot paths skip formatting."""
+    return DEBUG_ENABLED and category in ENABLED_CATEGORIES
+
+def log(category: str, message: str, *args: Any) -> None:
+    """
+    Print a categorised debug line.
+
+    Extra args are %-formatted into message only when the category is
+    enabled, like the stdlib logging module.
+    """
     if not DEBUG_ENABLED:
         return
     if category not in ENABLED_CATEGORIES:
         return
+    if args:
+        message = message % args
     print(f"[BATTLE {category.upper()}] {message}")
 
 
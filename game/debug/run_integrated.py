@@ -19,6 +19,7 @@ from engine.fx.system import FXSystem
 from engine.overworld.overworld_scene import OverworldScene, OverworldConfig
 
 from engine.battle.battle_arena import BattleArena
+from engine.battle.sprites import clear_frame_cache
 from engine.battle.skills.registry import initialize_defaults
 from engine.actors.character_sheet import CharacterInstance, new_default_party
 from engine.actors.enemy_sheet import initialize_enemy_templates
@@ -26,6 +27,7 @@ from engine.battle.action_phases import ActionPhase
 
 from engine.meta.ledger_state import LedgerState
 from engine.meta.battle_outcome import BattleOutcome
+from engine.battle.outcome_builder import log_as_dicts
 
 # -----------------------------
 # Battle asset wiring (v0)
@@ -108,8 +110,8 @@ def _build_outcome(arena: BattleArena) -> BattleOutcome:
     return BattleOutcome(
         victory=victory,
         defeat=defeat,
-        xp_log=list(getattr(session, "xp_log", []) or []),
-        loot_log=list(getattr(session, "loot_log", []) or []),
+        xp_log=log_as_dicts(getattr(session, "xp_log", None)),
+        loot_log=log_as_dicts(getattr(session, "loot_log", None)),
     )
 
 
@@ -243,6 +245,7 @@ def main() -> int:
             overworld.flags = ledger.world.flags
 
             arena = None
+            clear_frame_cache()  # battle sprites are gone with the arena
             mode = "overworld"
 
     pygame.quit()
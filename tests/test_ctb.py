@@ -0,0 +1,71 @@
+# tests/test_ctb.py
+#
+# Run from the repo root: python -m pytest -q
+
+from engine.battle.ctb import CTBSystem
+
+
+class _Actor:
+    def __init__(self, name, spd, hp=10):
+        self.name = name
+        self.spd = spd
+        self.hp = hp
+        self.status = None
+
+    @property
+    def alive(self):
+        return self.hp > 0
+
+
+def _run_until_batch(ctb, dt=0.01, limit=10_000):
+    for _ in range(limit):
+        batch = ctb.update(dt)
+        if batch:
+            return batch
+    raise AssertionError("no ready batch")
+
+
+def test_ko_actor_is_skipped_without_reset_gauge():
+    fast = _Actor("fast", spd=10)
+    slow = _Actor("slow", spd=5)
+    ctb = CTBSystem([fast], [slow])
+
+    assert _run_until_batch(ctb) == [fast]
+    ctb.reset_gauge(fast)
+
+    ctb.update(0.001)  # living set cached with `fast` in it
+
+    # KO'd by a DoT / bystander hit: HP written directly, no CTB call.
+    fast.hp = 0
+    for _ in range(5):
+        batch = _run_until_batch(ctb)
+        assert fast not in batch
+        for actor in batch:
+            ctb.reset_gauge(actor)
+
+
+def test_t_min_does_not_stall_on_ko_actor_slot():
+    fast = _Actor("fast", spd=10)
+    slow = _Actor("slow", spd=5)
+    ctb = CTBSystem([fast], [slow])
+    assert _run_until_batch(ctb) == [fast]
+    ctb.reset_gauge(fast)
+    ctb.update(0.001)  # t_min memoized at fast's next slot
+
+    fast.hp = 0
+    slow_turn = ctb.states[slow].next_turn_time
+    assert ctb.update(10.0) == [slow]
+    assert ctb.time == slow_turn
+
+
+def test_revived_actor_rejoins_queue():
+    fast = _Actor("fast", spd=10)
+    slow = _Actor("slow", spd=5)
+    ctb = CTBSystem([fast], [slow])
+    fast.hp = 0
+    assert _run_until_batch(ctb) == [slow]
+    ctb.reset_gauge(slow)
+    ctb.update(0.001)
+
+    fast.hp = 5
+    assert fast in _run_until_batch(ctb)
@@ -0,0 +1,27 @@
+# tests/test_damage.py
+#
+# Run from the repo root: python -m pytest -q
+
+from engine.battle.combatants import PlayerCombatant
+from engine.battle.damage import _read_base_stats, compute_damage
+
+
+def _player(**stats):
+    return PlayerCombatant("Setia", 100, sprite=None, stats=stats)
+
+
+def test_read_base_stats_player_combatant():
+    # PlayerCombatant exposes `res`, not `mres`: mres reads as 0.
+    p = _player(atk=12, mag=7, **{"def": 9, "res": 5, "spd": 11})
+    assert _read_base_stats(p) == (12.0, 7.0, 9.0, 0.0, 11.0)
+
+
+def test_compute_damage_player_defender():
+    attacker = _player(atk=20)
+    defender = _player(**{"def": 10})
+    raw, breakdown = compute_damage(
+        attacker, defender, base_damage=30.0, variance=0.0
+    )
+    # 30 - 10 * 0.6
+    assert raw == 24
+    assert breakdown["defensive"] == 10.0
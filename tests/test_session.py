@@ -0,0 +1,87 @@
+# tests/test_session.py
+#
+# Run from the repo root: python -m pytest -q
+
+from engine.battle.action_resolver import ActionResult, TargetResult
+from engine.battle.session import BattleSession
+
+
+class _Unit:
+    def __init__(self, cid, hp, max_hp):
+        self.id = cid
+        self.hp = hp
+        self.max_hp = max_hp
+
+
+def _heal(cid, amount):
+    return ActionResult(
+        actor_id=cid,
+        command_type="item",
+        targets=[TargetResult(target_id=cid, hp_delta=amount)],
+    )
+
+
+def test_hp_clamp_reads_current_max_hp():
+    hero = _Unit("hero", hp=50, max_hp=100)
+    session = BattleSession([hero], [])
+
+    hero.max_hp = 120  # level-up / equipment swap mid-battle
+    session.apply_action_result(_heal("hero", 100))
+    assert hero.hp == 120
+
+
+class _Statuses:
+    def __init__(self):
+        self.effects = []
+
+    def add(self, effect):
+        self.effects.append(effect)
+
+
+def test_status_applies_to_replaced_manager():
+    hero = _Unit("hero", hp=50, max_hp=100)
+    hero.status = _Statuses()
+    session = BattleSession([hero], [])
+
+    hero.status = fresh = _Statuses()  # e.g. reset between phases
+    session.apply_action_result(ActionResult(
+        actor_id="hero",
+        command_type="defend",
+        targets=[TargetResult(target_id="hero", status_applied=["defend_1"])],
+    ))
+    assert len(fresh.effects) == 1
+
+
+class _Effect:
+    def __init__(self, sid):
+        self.id = sid
+
+
+class _SlottedStatuses:
+    __slots__ = ("effects",)  # no __weakref__
+
+    def __init__(self, effects):
+        self.effects = effects
+
+
+class _UnhashableStatuses(_Statuses):
+    __hash__ = None
+
+
+def _strip(cid):
+    return ActionResult(
+        actor_id=cid,
+        command_type="item",
+        targets=[TargetResult(target_id=cid, status_removed=["poison"])],
+    )
+
+
+def test_status_removal_without_weakref_or_hash():
+    for mgr in (_SlottedStatuses([]), _UnhashableStatuses()):
+        mgr.effects[:] = [_Effect("poison"), _Effect("haste")]
+        hero = _Unit("hero", hp=50, max_hp=100)
+        hero.status = mgr
+        session = BattleSession([hero], [])
+
+        session.apply_action_result(_strip("hero"))
+        assert [e.id for e in mgr.effects] == ["haste"]
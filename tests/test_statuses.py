@@ -0,0 +1,23 @@
+# tests/test_statuses.py
+#
+# Run from the repo root: python -m pytest -q
+
+from types import MappingProxyType
+
+from engine.battle.skills.statuses import make_frostbite_basic
+
+
+class _Unit:
+    name = "unit"
+
+
+def test_frostbite_retaliates_against_mapping_context_attacker():
+    owner, attacker = _Unit(), _Unit()
+    frostbite = make_frostbite_basic(owner, owner, None)
+
+    context = MappingProxyType({"attacker": attacker})
+    _, _, events = frostbite.on_before_owner_takes_damage(
+        owner, 10, "physical", "physical", context
+    )
+    assert [ev.target for ev in events] == [attacker]
+    assert events[0].status.id == "frostbite_1"